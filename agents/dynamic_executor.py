@@ -8,12 +8,13 @@ AND the marginal ROI justifies the spend.
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
+from typing import Callable, Optional
 
 from CAL.llm import LLM
 
 from agents.evaluator import EvaluatorAgent
-from llm_provider import extract_response, make_user_message
+from llm_provider import extract_response, is_cache_hit, make_user_message
 from models import (
     TIER_MAX_TOKENS,
     TIER_MODELS,
@@ -85,43 +86,23 @@ def _build_context(
     dep_ids: list[int],
     outputs: dict[int, str],
 ) -> str:
-    parts = [f"OVERALL TASK: {task}\n", f"YOUR SUBTASK: {subtask_desc}\n"]
+    # Same layout as ExecutorAgent: static text leads, subtask text trails.
+    parts = [
+        "Produce a thorough, high-quality response for YOUR SUBTASK below. "
+        "Use the context from prior subtasks where relevant but DO NOT repeat "
+        "or restate their content — produce only NEW content.\n",
+        f"OVERALL TASK: {task}\n",
+    ]
     if dep_ids:
         parts.append("CONTEXT FROM PRIOR SUBTASKS:\n")
         for did in dep_ids:
             text = outputs.get(did, "")
             if text:
                 parts.append(f"--- Subtask {did} output ---\n{text}\n")
-    parts.append(
-        "Produce a thorough, high-quality response for YOUR SUBTASK. "
-        "Use the context above where relevant but DO NOT repeat or "
-        "restate content from prior subtasks — produce only NEW content."
-    )
+    parts.append(f"YOUR SUBTASK: {subtask_desc}")
     return "\n".join(parts)
 
 
-def _max_dag_depth(graph: TaskGraph) -> int:
-    subtask_map = {s.id: s for s in graph.subtasks}
-    cache: dict[int, int] = {}
-
-    def depth(sid: int) -> int:
-        if sid in cache:
-            return cache[sid]
-        deps = subtask_map[sid].dependencies
-        if not deps:
-            cache[sid] = 0
-            return 0
-        d = 1 + max(depth(d) for d in deps)
-        cache[sid] = d
-        return d
-
-    return max(depth(s.id) for s in graph.subtasks) if graph.subtasks else 0
-
-
-def _parallelizable_count(graph: TaskGraph) -> int:
-    return sum(1 for s in graph.subtasks if not s.dependencies)
-
-
 class DynamicExecutor:
     """ROI-driven executor that starts cheap and upgrades on evidence.
 
@@ -142,7 +123,14 @@ class DynamicExecutor:
         graph: TaskGraph,
         budget_dollars: float,
         planner_cost_dollars: float = 0.0,
+        on_subtask_done: Optional[Callable[[SubTaskResult], None]] = None,
     ) -> ExecutorResult:
+        """Run every subtask through the ROI tier ladder.
+
+        ``on_subtask_done`` is called with each SubTaskResult as soon as it
+        is accepted, so callers can start post-processing (e.g. scoring)
+        while later subtasks are still executing.
+        """
         subtask_map = {s.id: s for s in graph.subtasks}
         order = _topological_sort(graph)
         final_id = order[-1] if order else None
@@ -205,7 +193,10 @@ class DynamicExecutor:
                 )
 
                 output_text, p_tok, c_tok, _ = extract_response(response)
-                cost = _actual_cost(p_tok, c_tok, tier)
+                cost = (
+                    0.0 if is_cache_hit(response)
+                    else _actual_cost(p_tok, c_tok, tier)
+                )
 
                 score, reason = self.evaluator.quick_score(
                     subtask.description, output_text, task,
@@ -312,25 +303,26 @@ class DynamicExecutor:
             if not is_final:
                 upstream_spent += subtask_cost
 
-            results.append(
-                SubTaskResult(
-                    subtask_id=sid,
-                    description=subtask.description,
-                    tier=final_tier,
-                    model=TIER_MODELS[final_tier],
-                    tokens_budgeted=TIER_MAX_TOKENS[final_tier],
-                    prompt_tokens=total_prompt,
-                    completion_tokens=total_comp,
-                    total_tokens=total_tok,
-                    cost_dollars=subtask_cost,
-                    surplus=0,
-                    output=best.output if best else "",
-                    prompt=prompt,
-                    attempts=attempts,
-                    roi_decisions=decisions,
-                    final_attempt_index=best_idx,
-                )
+            sr = SubTaskResult(
+                subtask_id=sid,
+                description=subtask.description,
+                tier=final_tier,
+                model=TIER_MODELS[final_tier],
+                tokens_budgeted=TIER_MAX_TOKENS[final_tier],
+                prompt_tokens=total_prompt,
+                completion_tokens=total_comp,
+                total_tokens=total_tok,
+                cost_dollars=subtask_cost,
+                surplus=0,
+                output=best.output if best else "",
+                prompt=prompt,
+                attempts=attempts,
+                roi_decisions=decisions,
+                final_attempt_index=best_idx,
             )
+            results.append(sr)
+            if on_subtask_done is not None:
+                on_subtask_done(sr)
 
             logger.info(
                 "Subtask %d: accepted @ %s, %d attempts, $%.6f total",
@@ -366,17 +358,17 @@ class DynamicExecutor:
         utilization = (total_spent / budget * 100) if budget > 0 else 0.0
 
         tier_counts: dict[str, int] = {"fast": 0, "deep": 0, "verify": 0}
+        tok_budgeted = tok_consumed = tok_surplus = 0
         for r in results:
             tier_counts[r.tier.value] = tier_counts.get(r.tier.value, 0) + 1
+            tok_budgeted += r.tokens_budgeted
+            tok_consumed += r.completion_tokens
+            tok_surplus += r.surplus
 
-        tok_budgeted = sum(r.tokens_budgeted for r in results)
-        tok_consumed = sum(r.completion_tokens for r in results)
-        tok_surplus = sum(r.surplus for r in results)
         tok_efficiency = (tok_consumed / tok_budgeted * 100) if tok_budgeted > 0 else 0.0
 
         complexity_dist: dict[str, int] = {"low": 0, "medium": 0, "high": 0}
-        for s in graph.subtasks:
-            complexity_dist[s.complexity.value] += 1
+        complexity_dist.update(Counter(s.complexity.value for s in graph.subtasks))
 
         upgrade_descriptions = [
             f"Subtask {d.subtask_id}: {d.current_tier.value} → {d.proposed_tier.value} "
@@ -400,8 +392,8 @@ class DynamicExecutor:
             total_surplus=tok_surplus,
             token_efficiency_pct=tok_efficiency,
             total_subtasks=len(graph.subtasks),
-            max_depth=_max_dag_depth(graph),
-            parallelizable_subtasks=_parallelizable_count(graph),
+            max_depth=graph.max_depth,
+            parallelizable_subtasks=graph.parallelizable_subtasks,
             complexity_distribution=complexity_dist,
             total_upgrades=total_upgrades,
             roi_decisions=roi_decisions,
@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
 
-from google import genai
 from google.genai import types
 
 from pydantic import BaseModel, Field
 
+from llm_provider import get_genai_client
 from models import QualityScore
 
 logger = logging.getLogger(__name__)
@@ -71,10 +72,11 @@ class EvaluatorAgent:
     """
 
     def __init__(self, api_key: str, model: str = EVALUATOR_MODEL):
-        self.client = genai.Client(api_key=api_key)
+        self.client = get_genai_client(api_key)
         self.model = model
         self.total_tokens_used = 0
         self.total_cost_dollars = 0.0
+        self._usage_lock = threading.Lock()
 
     def quick_score(
         self,
@@ -105,8 +107,9 @@ class EvaluatorAgent:
         total_tokens = response.usage_metadata.total_token_count or 0
         input_cost = prompt_tokens * 0.10 / 1_000_000
         output_cost = completion_tokens * 0.40 / 1_000_000
-        self.total_cost_dollars += input_cost + output_cost
-        self.total_tokens_used += total_tokens
+        with self._usage_lock:
+            self.total_cost_dollars += input_cost + output_cost
+            self.total_tokens_used += total_tokens
 
         logger.info(
             "QuickEval scored %.1f/10 (%d tokens)", qs.score, total_tokens,
@@ -160,8 +163,9 @@ class EvaluatorAgent:
         # Track cumulative evaluation cost (flash-lite pricing)
         input_cost = prompt_tokens * 0.10 / 1_000_000
         output_cost = completion_tokens * 0.40 / 1_000_000
-        self.total_cost_dollars += input_cost + output_cost
-        self.total_tokens_used += total_tokens
+        with self._usage_lock:
+            self.total_cost_dollars += input_cost + output_cost
+            self.total_tokens_used += total_tokens
 
         logger.info(
             "Evaluator scored %.1f/10 (%d tokens, $%.6f cumulative)",
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import copy
+import heapq
 import logging
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from CAL.llm import LLM
+from CAL.message import Message
 
-from llm_provider import extract_response, make_user_message
+from llm_provider import extract_response, is_cache_hit, make_user_message
 from models import (
     TIER_MAX_TOKENS,
     TIER_PRICING_PER_1M_INPUT,
@@ -30,13 +34,13 @@ logger = logging.getLogger(__name__)
 
 def _topological_sort(graph: TaskGraph) -> list[int]:
     """Return subtask IDs in dependency-respecting execution order."""
-    adj: dict[int, list[int]] = {s.id: list(s.dependencies) for s in graph.subtasks}
     in_degree: dict[int, int] = {s.id: 0 for s in graph.subtasks}
     for s in graph.subtasks:
         for dep in s.dependencies:
             in_degree[s.id] += 1
 
     queue = [sid for sid, deg in in_degree.items() if deg == 0]
+    heapq.heapify(queue)
     order: list[int] = []
 
     dependents: dict[int, list[int]] = defaultdict(list)
@@ -45,17 +49,31 @@ def _topological_sort(graph: TaskGraph) -> list[int]:
             dependents[dep].append(s.id)
 
     while queue:
-        queue.sort()
-        sid = queue.pop(0)
+        sid = heapq.heappop(queue)
         order.append(sid)
         for child in dependents[sid]:
             in_degree[child] -= 1
             if in_degree[child] == 0:
-                queue.append(child)
+                heapq.heappush(queue, child)
 
     return order
 
 
+def _topological_layers(
+    graph: TaskGraph, priority: dict[int, int] | None = None,
+) -> list[list[int]]:
+    """Return the graph's dependency levels, each ordered for dispatch.
+
+    Within a level, lower ``priority`` values go first (ties, and the
+    default, fall back to subtask ID).
+    """
+    priority = priority or {}
+    return [
+        sorted(layer, key=lambda sid: (priority.get(sid, 0), sid))
+        for layer in graph.layers
+    ]
+
+
 def _build_context(
     task: str,
     subtask_desc: str,
@@ -63,7 +81,14 @@ def _build_context(
     outputs: dict[int, str],
 ) -> str:
     """Build the prompt sent to a tier agent."""
-    parts = [f"OVERALL TASK: {task}\n", f"YOUR SUBTASK: {subtask_desc}\n"]
+    # Static instructions first, then the run-wide task, then per-subtask
+    # text, so sibling prompts share the longest possible cacheable prefix.
+    parts = [
+        "Produce a thorough, high-quality response for YOUR SUBTASK below. "
+        "Use the context from prior subtasks where relevant but DO NOT repeat "
+        "or restate their content — produce only NEW content.\n",
+        f"OVERALL TASK: {task}\n",
+    ]
 
     if dep_ids:
         parts.append("CONTEXT FROM PRIOR SUBTASKS:\n")
@@ -72,14 +97,12 @@ def _build_context(
             if text:
                 parts.append(f"--- Subtask {did} output ---\n{text}\n")
 
-    parts.append(
-        "Produce a thorough, high-quality response for YOUR SUBTASK. "
-        "Use the context above where relevant but DO NOT repeat or "
-        "restate content from prior subtasks — produce only NEW content."
-    )
+    parts.append(f"YOUR SUBTASK: {subtask_desc}")
     return "\n".join(parts)
 
 
+_MAX_PARALLEL_SUBTASKS = 4
+
 def _subtask_cost(
     prompt_tokens: int, completion_tokens: int, tier: Tier
 ) -> float:
@@ -89,30 +112,6 @@ def _subtask_cost(
     return input_cost + output_cost
 
 
-def _max_dag_depth(graph: TaskGraph) -> int:
-    """Longest path through the DAG (number of edges)."""
-    subtask_map = {s.id: s for s in graph.subtasks}
-    cache: dict[int, int] = {}
-
-    def depth(sid: int) -> int:
-        if sid in cache:
-            return cache[sid]
-        deps = subtask_map[sid].dependencies
-        if not deps:
-            cache[sid] = 0
-            return 0
-        d = 1 + max(depth(d) for d in deps)
-        cache[sid] = d
-        return d
-
-    return max(depth(s.id) for s in graph.subtasks) if graph.subtasks else 0
-
-
-def _parallelizable_count(graph: TaskGraph) -> int:
-    """Count subtasks with no dependencies (could run concurrently)."""
-    return sum(1 for s in graph.subtasks if not s.dependencies)
-
-
 # ---------------------------------------------------------------------------
 # Executor
 # ---------------------------------------------------------------------------
@@ -147,98 +146,116 @@ class ExecutorAgent:
         surplus_pool = 0
         total_spent = planner_cost_dollars
 
+        # Deliverable order stays by subtask ID. Each dependency level runs
+        # concurrently, starting the largest allocations first (LPT) so long
+        # generations are not left as the tail of the level.
         order = _topological_sort(graph)
+        layers = _topological_layers(
+            graph, priority={a.subtask_id: -a.max_tokens for a in plan.allocations},
+        )
+        logger.debug("Execution layers (LPT within each): %s", layers)
+
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_SUBTASKS) as pool:
+            for layer in layers:
+                # --- Surplus redistribution and prompts (serial) -------------
+                prompts: dict[int, str] = {}
+                for sid in layer:
+                    alloc = alloc_map[sid]
+                    if alloc.skipped:
+                        continue
+
+                    tier_max = TIER_MAX_TOKENS[alloc.tier]
+                    if surplus_pool > 0 and alloc.max_tokens < tier_max:
+                        boost = min(surplus_pool, tier_max - alloc.max_tokens)
+                        alloc.max_tokens += boost
+                        surplus_pool -= boost
+                        logger.info(
+                            "Subtask %d: boosted max_tokens by %d from surplus (now %d)",
+                            sid, boost, alloc.max_tokens,
+                        )
+
+                    prompts[sid] = _build_context(
+                        task,
+                        subtask_map[sid].description,
+                        subtask_map[sid].dependencies,
+                        outputs,
+                    )
+
+                # --- Dispatch the whole level at once ------------------------
+                futures = {
+                    sid: pool.submit(self._dispatch, sid, alloc_map[sid], prompt)
+                    for sid, prompt in prompts.items()
+                }
+
+                # --- Record results in level order ---------------------------
+                for sid in layer:
+                    alloc = alloc_map[sid]
+                    subtask = subtask_map[sid]
+
+                    if alloc.skipped:
+                        results.append(
+                            SubTaskResult(
+                                subtask_id=sid,
+                                description=subtask.description,
+                                tier=alloc.tier,
+                                model=alloc.model,
+                                tokens_budgeted=0,
+                                prompt_tokens=0,
+                                completion_tokens=0,
+                                total_tokens=0,
+                                cost_dollars=0.0,
+                                surplus=0,
+                                output="",
+                                skipped=True,
+                            )
+                        )
+                        logger.info("Subtask %d: skipped by allocator", sid)
+                        continue
+
+                    prompt = prompts[sid]
+                    response = futures[sid].result()
+                    output_text, prompt_tokens, completion_tokens, total_tokens = (
+                        extract_response(response)
+                    )
+                    outputs[sid] = output_text
+
+                    cost = (
+                        0.0 if is_cache_hit(response)
+                        else _subtask_cost(prompt_tokens, completion_tokens, alloc.tier)
+                    )
+                    total_spent += cost
+
+                    surplus = max(0, alloc.max_tokens - completion_tokens)
+                    surplus_pool += surplus
+
+                    results.append(
+                        SubTaskResult(
+                            subtask_id=sid,
+                            description=subtask.description,
+                            tier=alloc.tier,
+                            model=alloc.model,
+                            tokens_budgeted=alloc.max_tokens,
+                            prompt_tokens=prompt_tokens,
+                            completion_tokens=completion_tokens,
+                            total_tokens=total_tokens,
+                            cost_dollars=cost,
+                            surplus=surplus,
+                            output=output_text,
+                            prompt=prompt,
+                        )
+                    )
 
-        for sid in order:
-            alloc = alloc_map[sid]
-            subtask = subtask_map[sid]
-
-            # --- Skip if allocator dropped this subtask ----------------------
-            if alloc.skipped:
-                results.append(
-                    SubTaskResult(
-                        subtask_id=sid,
-                        description=subtask.description,
-                        tier=alloc.tier,
-                        model=alloc.model,
-                        tokens_budgeted=0,
-                        prompt_tokens=0,
-                        completion_tokens=0,
-                        total_tokens=0,
-                        cost_dollars=0.0,
-                        surplus=0,
-                        output="",
-                        skipped=True,
+                    logger.info(
+                        "Subtask %d: consumed %d tokens ($%.6f), surplus %d",
+                        sid, total_tokens, cost, surplus,
                     )
-                )
-                logger.info("Subtask %d: skipped by allocator", sid)
-                continue
-
-            # --- Surplus redistribution (opportunistic) ----------------------
-            tier_max = TIER_MAX_TOKENS[alloc.tier]
-            if surplus_pool > 0 and alloc.max_tokens < tier_max:
-                boost = min(surplus_pool, tier_max - alloc.max_tokens)
-                alloc.max_tokens += boost
-                surplus_pool -= boost
-                logger.info(
-                    "Subtask %d: boosted max_tokens by %d from surplus (now %d)",
-                    sid, boost, alloc.max_tokens,
-                )
-
-            # --- Build prompt and dispatch -----------------------------------
-            prompt = _build_context(
-                task,
-                subtask.description,
-                subtask.dependencies,
-                outputs,
-            )
-
-            logger.info(
-                "Subtask %d → %s (%s, max_tokens=%d)",
-                sid, alloc.tier.value, alloc.model, alloc.max_tokens,
-            )
-
-            llm = self.tier_llms[alloc.tier]
-            llm.max_tokens = alloc.max_tokens
-            response = llm.generate_content(
-                system_prompt="",
-                conversation_history=[make_user_message(prompt)],
-            )
-
-            output_text, prompt_tokens, completion_tokens, total_tokens = (
-                extract_response(response)
-            )
-            outputs[sid] = output_text
-
-            cost = _subtask_cost(prompt_tokens, completion_tokens, alloc.tier)
-            total_spent += cost
-
-            surplus = max(0, alloc.max_tokens - completion_tokens)
-            surplus_pool += surplus
-
-            results.append(
-                SubTaskResult(
-                    subtask_id=sid,
-                    description=subtask.description,
-                    tier=alloc.tier,
-                    model=alloc.model,
-                    tokens_budgeted=alloc.max_tokens,
-                    prompt_tokens=prompt_tokens,
-                    completion_tokens=completion_tokens,
-                    total_tokens=total_tokens,
-                    cost_dollars=cost,
-                    surplus=surplus,
-                    output=output_text,
-                    prompt=prompt,
-                )
-            )
-
-            logger.info(
-                "Subtask %d: consumed %d tokens ($%.6f), surplus %d",
-                sid, total_tokens, cost, surplus,
-            )
 
         # --- Build report ----------------------------------------------------
+        # Results were recorded layer by layer (LPT within each); consumers
+        # read them positionally, so restore topological order.
+        position = {sid: i for i, sid in enumerate(order)}
+        results.sort(key=lambda r: position[r.subtask_id])
+
         deliverable = self._pick_deliverable(order, results, outputs)
         report = self._build_report(
             graph, plan, results, planner_cost_dollars, total_spent,
@@ -246,6 +263,24 @@ class ExecutorAgent:
 
         return ExecutorResult(deliverable=deliverable, report=report)
 
+    def _dispatch(
+        self, sid: int, alloc: SubTaskAllocation, prompt: str,
+    ) -> Message:
+        """Run one subtask at its allocated tier; safe to call concurrently."""
+        logger.info(
+            "Subtask %d → %s (%s, max_tokens=%d)",
+            sid, alloc.tier.value, alloc.model, alloc.max_tokens,
+        )
+        # Shallow copy: shares the client, but max_tokens is per call so
+        # concurrent subtasks on the same tier don't clobber each other.
+        llm = copy.copy(self.tier_llms[alloc.tier])
+        llm.max_tokens = alloc.max_tokens
+        response = llm.generate_content(
+            system_prompt="",
+            conversation_history=[make_user_message(prompt)],
+        )
+        return response
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
@@ -274,25 +309,25 @@ class ExecutorAgent:
         remaining = budget - total_spent
         utilization = (total_spent / budget * 100) if budget > 0 else 0.0
 
-        # Tier distribution
+        # Tier distribution, skips and token totals in one pass. Efficiency
+        # is measured against completion tokens since budget = max output.
         tier_counts: dict[str, int] = {"fast": 0, "deep": 0, "verify": 0}
+        skipped = tok_budgeted = tok_consumed = tok_surplus = 0
         for r in results:
-            if not r.skipped:
+            if r.skipped:
+                skipped += 1
+            else:
                 tier_counts[r.tier.value] = tier_counts.get(r.tier.value, 0) + 1
+            tok_budgeted += r.tokens_budgeted
+            tok_consumed += r.completion_tokens
+            tok_surplus += r.surplus
 
-        skipped = sum(1 for r in results if r.skipped)
         downgraded = len(plan.downgrades_applied)
-
-        # Efficiency (compared against completion tokens since budget = max output)
-        tok_budgeted = sum(r.tokens_budgeted for r in results)
-        tok_consumed = sum(r.completion_tokens for r in results)
-        tok_surplus = sum(r.surplus for r in results)
         tok_efficiency = (tok_consumed / tok_budgeted * 100) if tok_budgeted > 0 else 0.0
 
         # Task graph summary
         complexity_dist: dict[str, int] = {"low": 0, "medium": 0, "high": 0}
-        for s in graph.subtasks:
-            complexity_dist[s.complexity.value] += 1
+        complexity_dist.update(Counter(s.complexity.value for s in graph.subtasks))
 
         return CostReport(
             budget_dollars=budget,
@@ -309,7 +344,7 @@ class ExecutorAgent:
             total_surplus=tok_surplus,
             token_efficiency_pct=tok_efficiency,
             total_subtasks=len(graph.subtasks),
-            max_depth=_max_dag_depth(graph),
-            parallelizable_subtasks=_parallelizable_count(graph),
+            max_depth=graph.max_depth,
+            parallelizable_subtasks=graph.parallelizable_subtasks,
             complexity_distribution=complexity_dist,
         )
@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import closing
+from pathlib import Path
 from typing import Optional
 
-from google import genai
+import numpy as np
 from google.genai import types
 
+from llm_provider import get_genai_client
 from models import (
     Complexity,
     PlannerResult,
@@ -42,6 +51,164 @@ Rules:
 """
 
 
+# Plans are budget-independent, so a repeated task can reuse its plan. Opt-in
+# (PYRRHUS_CACHE_PLANS=1): a replayed plan reports zero planner cost, which
+# would skew the cost/quality data the experiments collect.
+PLAN_CACHE_DIR = Path(
+    os.getenv("PYRRHUS_CACHE_DIR", Path.home() / ".cache" / "pyrrhus")
+) / "plans"
+PLAN_CACHE_TTL_SECONDS = 7 * 24 * 3600
+PLAN_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+# Usage reported for plans served from either cache.
+_NO_USAGE = TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0)
+
+
+def _plan_cache_key(model: str, task: str) -> str:
+    h = hashlib.sha256()
+    for part in (model, SYSTEM_INSTRUCTION, task):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _load_cached_plan(path: Path) -> Optional[PlannerResult]:
+    """Return the cached plan at *path*, or None if missing/expired/corrupt."""
+    try:
+        if time.time() - path.stat().st_mtime > PLAN_CACHE_TTL_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        result = PlannerResult.model_validate_json(path.read_bytes())
+        os.utime(path)  # refresh for LRU eviction
+        return result
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable plan cache entry %s", path, exc_info=True)
+        return None
+
+
+def _store_cached_plan(path: Path, result: PlannerResult) -> None:
+    """Atomically write *result* to *path*, then evict least-recently-used
+    entries while the cache is over its size cap."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(result.model_dump_json())
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        entries = sorted(
+            (e.stat().st_mtime, e.stat().st_size, e)
+            for e in path.parent.glob("*.json")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= PLAN_CACHE_MAX_BYTES:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+    except Exception:
+        logger.warning("Could not write plan cache entry %s", path, exc_info=True)
+
+
+# Near-duplicate tasks (paraphrases) reuse a prior plan when their sentence
+# embeddings are close enough. Opt-in (PYRRHUS_PLAN_TEMPLATES=1) and needs
+# sentence-transformers: the encoder may download on first use, and a hit
+# hands back another task's graph.
+TEMPLATE_CACHE_DB = PLAN_CACHE_DIR / "templates.sqlite3"
+TEMPLATE_EMBED_MODEL = "all-MiniLM-L6-v2"
+TEMPLATE_MIN_SIMILARITY = 0.93
+TEMPLATE_CACHE_SIZE = 256
+
+_encoder = None  # False once sentence-transformers is known to be missing
+_encoder_lock = threading.Lock()
+
+
+def _embed_task(task: str) -> Optional[np.ndarray]:
+    """Unit-normalised embedding of *task*, or None without the encoder."""
+    global _encoder
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                # Imported here, not at module load: it pulls in torch, which
+                # only template lookups need.
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:  # optional: enables near-duplicate plan reuse
+                    _encoder = False
+                else:
+                    _encoder = SentenceTransformer(TEMPLATE_EMBED_MODEL)
+    if _encoder is False:
+        return None
+    return _encoder.encode(task, normalize_embeddings=True).astype(np.float32)
+
+
+def _template_db() -> sqlite3.Connection:
+    TEMPLATE_CACHE_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(TEMPLATE_CACHE_DB, timeout=10)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS templates ("
+        " id INTEGER PRIMARY KEY,"
+        " model TEXT NOT NULL,"
+        " embedding BLOB NOT NULL,"
+        " graph_json TEXT NOT NULL,"
+        " hits INTEGER NOT NULL DEFAULT 0)"
+    )
+    return conn
+
+
+def _lookup_template(model: str, embedding: np.ndarray) -> Optional[TaskGraph]:
+    """Return the stored graph most similar to *embedding*, if close enough."""
+    try:
+        with closing(_template_db()) as conn, conn:
+            rows = conn.execute(
+                "SELECT id, embedding, graph_json FROM templates WHERE model = ?",
+                (model,),
+            ).fetchall()
+            if not rows:
+                return None
+            matrix = np.stack([np.frombuffer(r[1], dtype=np.float32) for r in rows])
+            sims = matrix @ embedding
+            best = int(np.argmax(sims))
+            if sims[best] < TEMPLATE_MIN_SIMILARITY:
+                return None
+            conn.execute(
+                "UPDATE templates SET hits = hits + 1 WHERE id = ?", (rows[best][0],),
+            )
+            logger.info("Planner template hit (cosine %.3f)", sims[best])
+            return TaskGraph.model_validate_json(rows[best][2])
+    except Exception:
+        logger.warning("Plan template lookup failed", exc_info=True)
+        return None
+
+
+def _store_template(model: str, embedding: np.ndarray, graph: TaskGraph) -> None:
+    """Add a plan template, evicting the least-hit (then oldest) entries.
+
+    The new row is never the one evicted, so a cache full of hit entries
+    can still take in new tasks.
+    """
+    try:
+        with closing(_template_db()) as conn, conn:
+            new_id = conn.execute(
+                "INSERT INTO templates (model, embedding, graph_json) VALUES (?, ?, ?)",
+                (model, embedding.tobytes(), graph.model_dump_json()),
+            ).lastrowid
+            conn.execute(
+                "DELETE FROM templates WHERE id IN ("
+                " SELECT id FROM templates WHERE id != ? ORDER BY hits, id"
+                " LIMIT max(0, (SELECT COUNT(*) FROM templates) - ?))",
+                (new_id, TEMPLATE_CACHE_SIZE),
+            )
+    except Exception:
+        logger.warning("Could not store plan template", exc_info=True)
+
+
 def _validate_dag(graph: TaskGraph) -> None:
     """Raise ValueError if the graph has invalid references or cycles."""
     ids = {s.id for s in graph.subtasks}
@@ -82,16 +249,50 @@ class PlannerAgent:
     are applied downstream by the Allocator.
     """
 
-    def __init__(self, api_key: str, model: str = PLANNER_MODEL):
-        self.client = genai.Client(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = PLANNER_MODEL,
+        use_cache: Optional[bool] = None,
+        use_templates: Optional[bool] = None,
+    ):
+        self.client = get_genai_client(api_key)
         self.model = model
+        if use_cache is None:
+            use_cache = os.getenv("PYRRHUS_CACHE_PLANS", "") == "1"
+        if use_templates is None:
+            use_templates = os.getenv("PYRRHUS_PLAN_TEMPLATES", "") == "1"
+        self.use_cache = use_cache
+        self.use_templates = use_templates
 
     def plan(self, task: str) -> PlannerResult:
         """Decompose *task* into a validated TaskGraph.
 
         Returns a PlannerResult containing the graph and token usage so the
-        orchestrator can account for the planner's own cost.
+        orchestrator can account for the planner's own cost. A plan replayed
+        from the on-disk cache reports zero usage, since it cost nothing.
         """
+        cache_path = None
+        embedding = None
+        if self.use_cache:
+            cache_path = PLAN_CACHE_DIR / f"{_plan_cache_key(self.model, task)}.json"
+            cached = _load_cached_plan(cache_path)
+            if cached is not None:
+                logger.info(
+                    "Planner cache hit: %d subtasks", len(cached.graph.subtasks),
+                )
+                return cached.model_copy(update={"usage": _NO_USAGE})
+
+        if self.use_templates:
+            embedding = _embed_task(task)
+            if embedding is not None:
+                graph = _lookup_template(self.model, embedding)
+                if graph is not None:
+                    return PlannerResult(
+                        task=task, graph=graph, usage=_NO_USAGE,
+                        model="cache:template",
+                    )
+
         response = self.client.models.generate_content(
             model=self.model,
             contents=task,
@@ -118,9 +319,14 @@ class PlannerAgent:
             usage.total_tokens,
         )
 
-        return PlannerResult(
+        result = PlannerResult(
             task=task,
             graph=graph,
             usage=usage,
             model=self.model,
         )
+        if cache_path is not None:
+            _store_cached_plan(cache_path, result)
+        if embedding is not None:
+            _store_template(self.model, embedding, graph)
+        return result
@@ -59,18 +59,23 @@ def _ngram_repetition_rate(words: list[str], n: int = 3) -> float:
     """Fraction of n-grams that appear more than once."""
     if len(words) < n:
         return 0.0
-    ngrams = [tuple(words[i : i + n]) for i in range(len(words) - n + 1)]
-    counts = Counter(ngrams)
+    # zip over shifted views builds the n-gram tuples in C, without a
+    # Python-level slice per position.
+    counts = Counter(zip(*(words[i:] for i in range(n))))
     repeated = sum(1 for c in counts.values() if c > 1)
     return repeated / len(counts) if counts else 0.0
 
 
-def _avg_sentence_length(text: str) -> float:
-    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+def _avg_sentence_length(text: str, word_count: int) -> float:
+    """Mean words per sentence, given the word count of the whole *text*.
+
+    Sentence separators contain no letters, so the per-sentence word
+    counts always sum to *word_count* and the text needn't be re-scanned.
+    """
+    sentences = sum(1 for s in _SENTENCE_SPLIT.split(text) if s.strip())
     if not sentences:
         return 0.0
-    word_counts = [len(_WORD_SPLIT.findall(s)) for s in sentences]
-    return sum(word_counts) / len(word_counts)
+    return word_count / sentences
 
 
 def _filler_phrase_count(text_lower: str) -> int:
@@ -90,6 +95,6 @@ def compute_text_metrics(text: str) -> TextMetrics:
         type_token_ratio=round(_type_token_ratio(words), 4),
         compression_ratio=round(_compression_ratio(text), 4),
         ngram_repetition_rate=round(_ngram_repetition_rate(words), 4),
-        avg_sentence_length=round(_avg_sentence_length(text), 2),
+        avg_sentence_length=round(_avg_sentence_length(text, len(words)), 2),
         filler_phrase_count=_filler_phrase_count(text_lower),
     )
@@ -5,10 +5,16 @@ from __future__ import annotations
 import json
 import logging
 import os
+from datetime import datetime, timezone
 from pathlib import Path
 
 from supabase import Client, create_client
 
+try:
+    import orjson
+except ImportError:  # optional: faster graph_json (de)serialization
+    orjson = None
+
 from models import (
     PlannerTrace,
     QualityScore,
@@ -22,6 +28,15 @@ logger = logging.getLogger(__name__)
 
 _client: Client | None = None
 
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(data: dict) -> str:
+        return orjson.dumps(data).decode("utf-8")
+else:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 def _get_client() -> Client:
     """Lazily create and cache a Supabase client from env vars."""
@@ -42,6 +57,16 @@ def _get_client() -> Client:
 # ---------------------------------------------------------------------------
 
 
+def _stamp(trace: RunTrace) -> None:
+    """Fill timestamps still unset on *trace* and its children, e.g. subtask
+    traces appended after the RunTrace was built."""
+    ts = trace.timestamp or datetime.now(timezone.utc).isoformat()
+    trace.timestamp = ts
+    for child in (trace.planner_trace, *trace.subtask_traces):
+        if child.timestamp is None:
+            child.timestamp = ts
+
+
 def save_trace(trace: RunTrace, directory: str | Path | None = None) -> str:
     """Persist a RunTrace to Supabase across the runs, planner_traces,
     and subtask_traces tables.  Returns the run_id.
@@ -50,6 +75,7 @@ def save_trace(trace: RunTrace, directory: str | Path | None = None) -> str:
     ignored — traces are stored in Supabase, not on disk.
     """
     client = _get_client()
+    _stamp(trace)
 
     dq = trace.deliverable_quality
     run_row = {
@@ -77,7 +103,7 @@ def save_trace(trace: RunTrace, directory: str | Path | None = None) -> str:
         "completion_tokens": pt.completion_tokens,
         "total_tokens": pt.total_tokens,
         "cost_dollars": pt.cost_dollars,
-        "graph_json": json.loads(pt.graph_json) if pt.graph_json else {},
+        "graph_json": _loads(pt.graph_json) if pt.graph_json else {},
     }
     client.table("planner_traces").insert(planner_row).execute()
 
@@ -174,7 +200,7 @@ def _rows_to_traces(
             total_tokens=pt_row.get("total_tokens", 0),
             cost_dollars=pt_row.get("cost_dollars", 0.0),
             graph_json=(
-                json.dumps(graph_json_val)
+                _dumps(graph_json_val)
                 if isinstance(graph_json_val, dict)
                 else str(graph_json_val)
             ),
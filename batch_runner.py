@@ -68,7 +68,7 @@ def _build_trace(
         text_metrics = compute_text_metrics(sr.output) if sr.output else None
 
         subtask_traces.append(
-            SubTaskTrace(
+            SubTaskTrace.model_construct(
                 subtask_id=sr.subtask_id,
                 description=sr.description,
                 tier=sr.tier,
@@ -152,16 +152,19 @@ def run_batch(
     delay_between_launches: float = 1.0,
     evaluate: bool = True,
     save: bool = True,
+    planner_result: Optional[PlannerResult] = None,
 ) -> list[RunTrace]:
     """Run the pipeline at each budget level and return all traces.
 
     The planner is called once and shared across all runs so that
-    budget is the only variable.
+    budget is the only variable. Pass ``planner_result`` to reuse a plan
+    the caller already has.
     """
     logger.info("Batch run: task=%r, budgets=%s", task, budgets)
 
-    planner = PlannerAgent(api_key=api_key)
-    planner_result = planner.plan(task)
+    if planner_result is None:
+        planner = PlannerAgent(api_key=api_key)
+        planner_result = planner.plan(task)
     logger.info("Planner produced %d subtasks", len(planner_result.graph.subtasks))
 
     traces: list[RunTrace] = []
@@ -1,15 +1,14 @@
 from __future__ import annotations
 
+import logging
 import os
-import sys
+from dataclasses import asdict
 from pathlib import Path
 
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 
-# Allow imports from the project root
-sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 load_dotenv(Path(__file__).resolve().parent.parent / ".env")
 
 from agents.dynamic_executor import DynamicExecutor
@@ -33,10 +32,30 @@ from models import (
     Tier,
 )
 
+logger = logging.getLogger(__name__)
+
+GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
+if not GOOGLE_API_KEY:
+    logger.warning("GOOGLE_API_KEY not configured — /api/run and /api/batch will fail")
+
 app = Flask(__name__)
 CORS(app)
 
-latest_report: dict | None = None
+# Registered at import so WSGI servers loading ``dashboard.app:app`` get the
+# compare endpoints too, not only ``python -m dashboard.app``.
+try:
+    from dashboard.compare import compare_bp
+except ImportError:
+    logger.warning("Compare view disabled: dashboard.compare failed to import", exc_info=True)
+    compare_bp = None
+
+COMPARE_ENABLED = compare_bp is not None
+if COMPARE_ENABLED:
+    app.register_blueprint(compare_bp)
+
+# Serialized once per /api/run so /api/report can serve it without
+# re-encoding the (static until the next run) report on every poll.
+latest_report_json: str | None = None
 
 
 def _planner_cost(prompt_tokens: int, completion_tokens: int) -> float:
@@ -56,6 +75,30 @@ def _short_label(description: str, max_words: int = 3) -> str:
     return label
 
 
+def _roi_to_dict(d: ROIDecision, cache: dict[int, dict]) -> dict:
+    """Serialize an ROIDecision, reusing the dict if already converted.
+
+    The same decision objects appear both per-subtask and in the report's
+    top-level list, so *cache* (keyed by ``id(d)``) is scoped to one request.
+    """
+    key = id(d)
+    out = cache.get(key)
+    if out is None:
+        out = {
+            "subtask_id": d.subtask_id,
+            "current_tier": d.current_tier.value,
+            "current_quality": d.current_quality,
+            "proposed_tier": d.proposed_tier.value,
+            "upgrade_cost_estimate": d.upgrade_cost_estimate,
+            "expected_quality_lift": d.expected_quality_lift,
+            "roi": d.roi,
+            "decision": d.decision,
+            "reason": d.reason,
+        }
+        cache[key] = out
+    return out
+
+
 def _to_frontend_json(
     task: str,
     budget: float,
@@ -73,6 +116,7 @@ def _to_frontend_json(
     subtask_map = {s.id: s for s in graph.subtasks}
     sq = subtask_qualities or {}
     stm = subtask_text_metrics or {}
+    roi_cache: dict[int, dict] = {}
 
     budget_summary = {
         "dollar_budget": r.budget_dollars,
@@ -109,18 +153,7 @@ def _to_frontend_json(
             ]
         if sr.roi_decisions:
             entry["roi_decisions"] = [
-                {
-                    "subtask_id": d.subtask_id,
-                    "current_tier": d.current_tier.value,
-                    "current_quality": d.current_quality,
-                    "proposed_tier": d.proposed_tier.value,
-                    "upgrade_cost_estimate": d.upgrade_cost_estimate,
-                    "expected_quality_lift": d.expected_quality_lift,
-                    "roi": d.roi,
-                    "decision": d.decision,
-                    "reason": d.reason,
-                }
-                for d in sr.roi_decisions
+                _roi_to_dict(d, roi_cache) for d in sr.roi_decisions
             ]
         subtask_metrics.append(entry)
 
@@ -136,17 +169,7 @@ def _to_frontend_json(
             })
 
     # 4. Upgrade report (ROI-driven decisions)
-    upgrade_decisions = []
-    for d in r.roi_decisions:
-        upgrade_decisions.append({
-            "subtask_id": d.subtask_id,
-            "current_tier": d.current_tier.value,
-            "current_quality": d.current_quality,
-            "proposed_tier": d.proposed_tier.value,
-            "roi": d.roi,
-            "decision": d.decision,
-            "reason": d.reason,
-        })
+    upgrade_decisions = [_roi_to_dict(d, roi_cache) for d in r.roi_decisions]
 
     upgrade_report = {
         "total_upgrades": r.total_upgrades,
@@ -253,9 +276,9 @@ def _to_frontend_json(
 
 @app.route("/api/run", methods=["POST"])
 def run():
-    global latest_report
+    global latest_report_json
 
-    api_key = os.getenv("GOOGLE_API_KEY")
+    api_key = GOOGLE_API_KEY
     if not api_key:
         return jsonify({"error": "GOOGLE_API_KEY not configured"}), 500
 
@@ -313,8 +336,8 @@ def run():
                     pass
             tm = compute_text_metrics(sr.output) if sr.output else None
             if tm:
-                subtask_text_metrics_map[sr.subtask_id] = tm.model_dump()
-            subtask_traces.append(SubTaskTrace(
+                subtask_text_metrics_map[sr.subtask_id] = asdict(tm)
+            subtask_traces.append(SubTaskTrace.model_construct(
                 subtask_id=sr.subtask_id, description=sr.description,
                 tier=sr.tier, model=sr.model, max_tokens=sr.tokens_budgeted,
                 prompt=sr.prompt, output=sr.output,
@@ -332,7 +355,7 @@ def run():
             except Exception:
                 pass
             dtm = compute_text_metrics(result.deliverable)
-            deliverable_tm_dict = dtm.model_dump()
+            deliverable_tm_dict = asdict(dtm)
 
         eval_cost = evaluator.total_cost_dollars
 
@@ -356,20 +379,20 @@ def run():
         deliverable_text_metrics=deliverable_tm_dict,
         evaluation_cost=eval_cost,
     )
-    latest_report = frontend_json
-    return jsonify(frontend_json)
+    latest_report_json = app.json.dumps(frontend_json)
+    return app.response_class(latest_report_json, mimetype="application/json")
 
 
 @app.route("/api/report")
 def api_report():
-    if latest_report is None:
+    if latest_report_json is None:
         return jsonify({"error": "No report available. Run a task first."}), 404
-    return jsonify(latest_report)
+    return app.response_class(latest_report_json, mimetype="application/json")
 
 
 @app.route("/api/batch", methods=["POST"])
 def batch():
-    api_key = os.getenv("GOOGLE_API_KEY")
+    api_key = GOOGLE_API_KEY
     if not api_key:
         return jsonify({"error": "GOOGLE_API_KEY not configured"}), 500
 
@@ -400,7 +423,7 @@ def batch():
             "spent": tr.total_cost_dollars,
             "quality": tr.deliverable_quality.overall if tr.deliverable_quality else None,
             "quality_scores": tr.deliverable_quality.model_dump() if tr.deliverable_quality else None,
-            "text_metrics": dm.model_dump() if dm else None,
+            "text_metrics": asdict(dm) if dm else None,
             "evaluation_cost": tr.evaluation_cost_dollars,
             "subtask_count": len(tr.subtask_traces),
             "skipped_count": sum(1 for s in tr.subtask_traces if s.skipped),
@@ -524,7 +547,4 @@ def comparisons_stats():
 
 
 if __name__ == "__main__":
-    sys.path.insert(0, str(Path(__file__).resolve().parent))
-    from compare import compare_bp
-    app.register_blueprint(compare_bp)
     app.run(debug=True, port=5001)
@@ -6,22 +6,31 @@ depend on files outside the core agent pipeline.
 
 from __future__ import annotations
 
-import gzip
+import hashlib
+import heapq
 import json
 import logging
 import os
-import queue
 import re
 import threading
-from collections import Counter, defaultdict
+import time
+import zlib
+from collections import Counter, OrderedDict, defaultdict, deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 from flask import Blueprint, Response, request
 from google import genai
 from google.genai import types
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+except ImportError:  # optional: faster SSE encoding
+    orjson = None
+
 from agents.evaluator import EvaluatorAgent
 from agents.planner import PlannerAgent
+from llm_provider import get_genai_client
 from models import (
     TIER_MAX_TOKENS,
     TIER_MODELS,
@@ -62,23 +71,56 @@ Be critical. Reserve 9-10 for exceptional work only.\
 """
 
 
+_EVAL_MODEL = "gemini-2.5-flash-lite"
+_EVAL_CONFIG = types.GenerateContentConfig(
+    system_instruction=EVAL_SYSTEM,
+    response_mime_type="application/json",
+    response_schema=QualityScore,
+    temperature=0.1,
+)
+
+# Scores keyed by a hash of the eval inputs. Temperature 0.1 + structured
+# output make re-scoring the same deliverable near-deterministic, so repeat
+# runs (retries, refreshes, dataset re-collection) reuse the prior score.
+_EVAL_CACHE_SIZE = 512
+_eval_cache: OrderedDict[str, dict] = OrderedDict()
+_eval_cache_lock = threading.Lock()
+
+
+def _eval_cache_key(task: str, deliverable: str) -> str:
+    h = hashlib.sha256()
+    for part in (_EVAL_MODEL, EVAL_SYSTEM, task, deliverable):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
 def _evaluate(client: genai.Client, task: str, deliverable: str) -> dict | None:
+    key = _eval_cache_key(task, deliverable)
+    with _eval_cache_lock:
+        cached = _eval_cache.get(key)
+        if cached is not None:
+            _eval_cache.move_to_end(key)
+            return dict(cached)
+
     try:
         resp = client.models.generate_content(
-            model="gemini-2.5-flash-lite",
+            model=_EVAL_MODEL,
             contents=f"USER TASK: {task}\n\nDELIVERABLE:\n{deliverable}",
-            config=types.GenerateContentConfig(
-                system_instruction=EVAL_SYSTEM,
-                response_mime_type="application/json",
-                response_schema=QualityScore,
-                temperature=0.1,
-            ),
+            config=_EVAL_CONFIG,
         )
-        return QualityScore.model_validate_json(resp.text).model_dump()
+        score = QualityScore.model_validate_json(resp.text).model_dump()
     except Exception:
         logger.warning("Evaluation failed", exc_info=True)
         return None
 
+    with _eval_cache_lock:
+        _eval_cache[key] = score
+        _eval_cache.move_to_end(key)
+        while len(_eval_cache) > _EVAL_CACHE_SIZE:
+            _eval_cache.popitem(last=False)
+    return dict(score)
+
 
 # ---------------------------------------------------------------------------
 # Inline text metrics
@@ -97,6 +139,11 @@ FILLER_PHRASES = [
     "it goes without saying", "needless to say",
 ]
 
+# One pass over the text instead of one ``str.count`` scan per phrase.
+_FILLER_RE = re.compile("|".join(re.escape(p) for p in FILLER_PHRASES))
+
+_MIN_COMPRESS_BYTES = 256
+
 
 def _text_metrics(text: str) -> dict:
     if not text or not text.strip():
@@ -106,21 +153,29 @@ def _text_metrics(text: str) -> dict:
 
     text_lower = text.lower()
     words = _WORD_SPLIT.findall(text_lower)
-    wc = len(words)
-    ttr = len(set(words)) / wc if wc else 0
-
+    word_counts = Counter(words)
+    wc = word_counts.total()
+    ttr = len(word_counts) / wc if wc else 0
+
+    # Only the ratio matters here, so use zlib (deflate with a small zlib
+    # header) at level 1: much cheaper than gzip level 6 and within a few
+    # percent of its ratio. Below a few hundred bytes the stream overhead
+    # dominates and the ratio means nothing.
     raw = text.encode("utf-8")
-    comp = gzip.compress(raw, compresslevel=6)
-    cr = len(comp) / len(raw) if raw else 0
+    if len(raw) < _MIN_COMPRESS_BYTES:
+        cr = 0.0
+    else:
+        cr = len(zlib.compress(raw, 1)) / len(raw)
 
-    ngrams = [tuple(words[i:i + 3]) for i in range(len(words) - 2)] if len(words) >= 3 else []
-    counts = Counter(ngrams)
-    ngram_rep = sum(1 for c in counts.values() if c > 1) / len(counts) if counts else 0
+    trigram_counts = Counter(zip(words, words[1:], words[2:]))
+    ngram_rep = (sum(1 for c in trigram_counts.values() if c > 1) / len(trigram_counts)
+                 if trigram_counts else 0)
 
-    sentences = [s.strip() for s in _SENTENCE_SPLIT.split(text) if s.strip()]
-    avg_sl = sum(len(_WORD_SPLIT.findall(s)) for s in sentences) / len(sentences) if sentences else 0
+    # Separators contain no letters, so the per-sentence word counts sum to wc.
+    sentences = [s for s in _SENTENCE_SPLIT.split(text) if s.strip()]
+    avg_sl = wc / len(sentences) if sentences else 0
 
-    fillers = sum(text_lower.count(p) for p in FILLER_PHRASES)
+    fillers = sum(1 for _ in _FILLER_RE.finditer(text_lower))
 
     return {
         "word_count": wc,
@@ -143,6 +198,7 @@ def _topological_sort(graph: TaskGraph) -> list[int]:
             in_degree[s.id] += 1
 
     q = [sid for sid, deg in in_degree.items() if deg == 0]
+    heapq.heapify(q)
     order: list[int] = []
 
     dependents: dict[int, list[int]] = defaultdict(list)
@@ -151,30 +207,31 @@ def _topological_sort(graph: TaskGraph) -> list[int]:
             dependents[dep].append(s.id)
 
     while q:
-        q.sort()
-        sid = q.pop(0)
+        sid = heapq.heappop(q)
         order.append(sid)
         for child in dependents[sid]:
             in_degree[child] -= 1
             if in_degree[child] == 0:
-                q.append(child)
+                heapq.heappush(q, child)
     return order
 
 
 def _build_context(task: str, subtask_desc: str, dep_ids: list[int],
                    outputs: dict[int, str]) -> str:
-    parts = [f"OVERALL TASK: {task}\n", f"YOUR SUBTASK: {subtask_desc}\n"]
+    # Keep in sync with the executors' prompt layout (static prefix first).
+    parts = [
+        "Produce a thorough, high-quality response for YOUR SUBTASK below. "
+        "Use the context from prior subtasks where relevant but DO NOT repeat "
+        "or restate their content — produce only NEW content.\n",
+        f"OVERALL TASK: {task}\n",
+    ]
     if dep_ids:
         parts.append("CONTEXT FROM PRIOR SUBTASKS:\n")
         for did in dep_ids:
             text = outputs.get(did, "")
             if text:
                 parts.append(f"--- Subtask {did} output ---\n{text}\n")
-    parts.append(
-        "Produce a thorough, high-quality response for YOUR SUBTASK. "
-        "Use the context above where relevant but DO NOT repeat or "
-        "restate content from prior subtasks — produce only NEW content."
-    )
+    parts.append(f"YOUR SUBTASK: {subtask_desc}")
     return "\n".join(parts)
 
 
@@ -186,8 +243,113 @@ def _planner_cost(prompt_tokens: int, completion_tokens: int) -> float:
     )
 
 
-def _sse(event: str, data: dict) -> str:
-    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+if orjson is not None:
+    def _dumps(data: dict) -> bytes:
+        return orjson.dumps(data)
+else:
+    def _dumps(data: dict) -> bytes:
+        return json.dumps(data).encode("utf-8")
+
+
+_SSE_PREFIX = {
+    name: f"event: {name}\ndata: ".encode()
+    for name in (
+        "plan", "pyrrhus_chunk", "baseline_chunk", "roi_decision",
+        "pyrrhus_subtask_done", "baseline_done", "thread_done",
+        "quality", "text_metrics", "done", "error",
+    )
+}
+_SSE_SUFFIX = b"\n\n"
+
+
+def _sse(event: str, data: dict) -> bytes:
+    # KeyError on an unknown event name is deliberate: it catches typos.
+    return _SSE_PREFIX[event] + _dumps(data) + _SSE_SUFFIX
+
+
+def _gzip_stream(chunks):
+    """Gzip an SSE stream, sync-flushing after each event so it is not held
+    back in the compressor waiting for more input."""
+    co = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        yield co.compress(chunk) + co.flush(zlib.Z_SYNC_FLUSH)
+    yield co.flush(zlib.Z_FINISH)
+
+
+# ---------------------------------------------------------------------------
+# Worker → SSE event channel
+# ---------------------------------------------------------------------------
+
+_EVENT_WAIT_SECONDS = 5.0
+_STREAM_IDLE_TIMEOUT = 120.0
+
+
+class _EventChannel:
+    """Many-producer, single-consumer event buffer for the SSE loop.
+
+    Producers only signal the consumer on an empty → non-empty transition,
+    and the consumer takes everything pending in one go, so chunk storms
+    cost one append per event rather than a condvar notify each.
+    """
+
+    def __init__(self) -> None:
+        self._items: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+
+    def put(self, evt: dict) -> None:
+        with self._lock:
+            was_empty = not self._items
+            self._items.append(evt)
+        if was_empty:
+            self._ready.set()
+
+    def drain(self, timeout: float) -> list[dict]:
+        """Return all pending events, waiting up to *timeout* seconds if none."""
+        with self._lock:
+            if not self._items:
+                self._ready.clear()
+        if not self._ready.wait(timeout):
+            return []
+        with self._lock:
+            items = list(self._items)
+            self._items.clear()
+        return items
+
+
+_CHUNK_FLUSH_CHARS = 512
+_CHUNK_FLUSH_SECONDS = 0.05
+
+
+class _DeltaBuffer:
+    """Coalesces streamed text deltas into fewer, larger chunk events.
+
+    Gemini emits many small deltas per second; batching them by size or
+    age cuts the number of queued events and SSE frames without a visible
+    delay on the client.
+    """
+
+    def __init__(self) -> None:
+        self._parts: list[str] = []
+        self._size = 0
+        self._last_flush = time.monotonic()
+
+    def __bool__(self) -> bool:
+        return bool(self._parts)
+
+    def add(self, delta: str) -> bool:
+        """Buffer *delta*; return True when the buffer is due to be flushed."""
+        self._parts.append(delta)
+        self._size += len(delta)
+        return (self._size >= _CHUNK_FLUSH_CHARS
+                or time.monotonic() - self._last_flush >= _CHUNK_FLUSH_SECONDS)
+
+    def take(self) -> str:
+        text = "".join(self._parts)
+        self._parts.clear()
+        self._size = 0
+        self._last_flush = time.monotonic()
+        return text
 
 
 # ---------------------------------------------------------------------------
@@ -203,6 +365,7 @@ _EXPECTED_LIFT = {
 _QUALITY_THRESHOLD = 6.0
 _MIN_ROI = 50.0
 _SYNTHESIS_RESERVE = 0.35
+_MAX_PARALLEL_SUBTASKS = 4
 
 
 def _estimate_tier_cost(tier: Tier) -> float:
@@ -215,12 +378,20 @@ def _estimate_tier_cost(tier: Tier) -> float:
 
 def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
                  planner_cost_dollars: float, budget_dollars: float,
-                 api_key: str, event_queue: queue.Queue) -> None:
-    """Run the dynamic ROI executor with streaming, emitting SSE events."""
+                 api_key: str, event_queue: _EventChannel) -> None:
+    """Run the dynamic ROI executor with streaming, emitting SSE events.
+
+    Upstream subtasks run concurrently as soon as their dependencies are
+    done; the final (synthesis) subtask runs last against what is left of
+    the budget. Each attempt reserves its estimated cost under the lock
+    before it starts and swaps in the real cost when it finishes, so
+    concurrent siblings cannot jointly overspend the caps.
+    """
     try:
         evaluator = EvaluatorAgent(api_key=api_key)
         subtask_map = {s.id: s for s in graph.subtasks}
         order = _topological_sort(graph)
+        position = {sid: idx for idx, sid in enumerate(order)}
         total_subtasks = len(order)
         final_id = order[-1] if order else None
 
@@ -228,80 +399,119 @@ def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
         synthesis_reserve = remaining_total * _SYNTHESIS_RESERVE
         upstream_budget = remaining_total - synthesis_reserve
 
+        state_lock = threading.Lock()
         outputs: dict[int, str] = {}
         total_cost = planner_cost_dollars
         upstream_spent = 0.0
+        reserved = 0.0
+        upstream_reserved = 0.0
 
-        for idx, sid in enumerate(order):
+        def _available(is_final: bool) -> float:
+            # Caller holds state_lock.
+            overall = budget_dollars - total_cost - reserved
+            if is_final:
+                return overall
+            return min(upstream_budget - upstream_spent - upstream_reserved, overall)
+
+        def available_for(is_final: bool) -> float:
+            with state_lock:
+                return _available(is_final)
+
+        def reserve(amount: float, is_final: bool) -> bool:
+            nonlocal reserved, upstream_reserved
+            with state_lock:
+                if amount > _available(is_final):
+                    return False
+                reserved += amount
+                if not is_final:
+                    upstream_reserved += amount
+                return True
+
+        def settle(amount: float, cost: float, is_final: bool) -> None:
+            nonlocal total_cost, upstream_spent, reserved, upstream_reserved
+            with state_lock:
+                reserved -= amount
+                total_cost += cost
+                if not is_final:
+                    upstream_reserved -= amount
+                    upstream_spent += cost
+
+        def run_subtask(sid: int) -> None:
             subtask = subtask_map[sid]
             is_final = sid == final_id
+            progress = f"{position[sid] + 1}/{total_subtasks}"
 
-            if is_final:
-                available = budget_dollars - total_cost
-            else:
-                available = min(
-                    upstream_budget - upstream_spent,
-                    budget_dollars - total_cost,
-                )
-
-            prompt = _build_context(task, subtask.description,
-                                    subtask.dependencies, outputs)
+            with state_lock:
+                prompt = _build_context(task, subtask.description,
+                                        subtask.dependencies, outputs)
 
             tier_idx = 0
             best_output = ""
             best_quality = 0.0
             best_tier = Tier.FAST
             subtask_cost = 0.0
+            c_tok = 0
 
             while tier_idx < len(_TIER_LADDER):
                 tier = _TIER_LADDER[tier_idx]
+                price_out = TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
                 est = _estimate_tier_cost(tier)
-                if est > available:
+                if not reserve(est, is_final):
                     break
 
-                output_chunks: list[str] = []
-                est_output_tokens = 0
-                last_chunk = None
-
-                for chunk in client.models.generate_content_stream(
-                    model=TIER_MODELS[tier],
-                    contents=prompt,
-                    config=types.GenerateContentConfig(
-                        max_output_tokens=TIER_MAX_TOKENS[tier],
-                        temperature=0.4,
-                    ),
-                ):
-                    last_chunk = chunk
-                    delta = chunk.text or ""
-                    if delta:
-                        output_chunks.append(delta)
-                        est_output_tokens += max(1, len(delta) // 4)
-                        est_cost = est_output_tokens * TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
+                cost = 0.0
+                try:
+                    output_buf = bytearray()
+                    est_output_tokens = 0
+                    last_chunk = None
+                    pending = _DeltaBuffer()
+
+                    def flush_pending() -> None:
+                        est_cost = est_output_tokens * price_out
                         event_queue.put({
                             "type": "pyrrhus_chunk",
                             "data": {
-                                "subtask_id": sid, "delta": delta,
+                                "subtask_id": sid, "delta": pending.take(),
                                 "tier": tier.value,
-                                "cost_so_far": round(total_cost + subtask_cost + est_cost, 8),
-                                "progress": f"{idx + 1}/{total_subtasks}",
+                                "cost_so_far": round(total_cost + est_cost, 8),
+                                "progress": progress,
                             },
                         })
 
-                full_output = "".join(output_chunks)
-
-                p_tok = 0
-                c_tok = est_output_tokens
-                if last_chunk and hasattr(last_chunk, "usage_metadata") and last_chunk.usage_metadata:
-                    um = last_chunk.usage_metadata
-                    p_tok = um.prompt_token_count or 0
-                    c_tok = um.candidates_token_count or est_output_tokens
-
-                cost = (
-                    p_tok * TIER_PRICING_PER_1M_INPUT[tier] / 1_000_000
-                    + c_tok * TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
-                )
+                    for chunk in client.models.generate_content_stream(
+                        model=TIER_MODELS[tier],
+                        contents=prompt,
+                        config=types.GenerateContentConfig(
+                            max_output_tokens=TIER_MAX_TOKENS[tier],
+                            temperature=0.4,
+                        ),
+                    ):
+                        last_chunk = chunk
+                        delta = chunk.text or ""
+                        if delta:
+                            output_buf.extend(delta.encode("utf-8"))
+                            est_output_tokens += max(1, len(delta) // 4)
+                            if pending.add(delta):
+                                flush_pending()
+                    if pending:
+                        flush_pending()
+
+                    full_output = output_buf.decode("utf-8")
+
+                    p_tok = 0
+                    c_tok = est_output_tokens
+                    if last_chunk and hasattr(last_chunk, "usage_metadata") and last_chunk.usage_metadata:
+                        um = last_chunk.usage_metadata
+                        p_tok = um.prompt_token_count or 0
+                        c_tok = um.candidates_token_count or est_output_tokens
+
+                    cost = (
+                        p_tok * TIER_PRICING_PER_1M_INPUT[tier] / 1_000_000
+                        + c_tok * price_out
+                    )
+                finally:
+                    settle(est, cost, is_final)
                 subtask_cost += cost
-                available -= cost
 
                 try:
                     score, reason = evaluator.quick_score(
@@ -323,6 +533,7 @@ def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
                     upgrade_est = _estimate_tier_cost(next_tier)
                     lift = _EXPECTED_LIFT.get((tier, next_tier), 2.0)
                     roi = lift / upgrade_est if upgrade_est > 0 else 0.0
+                    available = available_for(is_final)
 
                     if roi >= _MIN_ROI and upgrade_est <= available:
                         event_queue.put({
@@ -355,10 +566,9 @@ def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
                         })
                 break
 
-            outputs[sid] = best_output
-            total_cost += subtask_cost
-            if not is_final:
-                upstream_spent += subtask_cost
+            with state_lock:
+                outputs[sid] = best_output
+                cost_so_far = total_cost
 
             event_queue.put({
                 "type": "pyrrhus_subtask_done",
@@ -368,12 +578,39 @@ def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
                     "quality": round(best_quality, 1),
                     "tokens": c_tok,
                     "cost": round(subtask_cost, 8),
-                    "cost_so_far": round(total_cost, 8),
+                    "cost_so_far": round(cost_so_far, 8),
                     "output": best_output,
-                    "progress": f"{idx + 1}/{total_subtasks}",
+                    "progress": progress,
                 },
             })
 
+        # The final subtask comes last in topological order, so nothing
+        # depends on it; schedule everything else by dependency readiness.
+        remaining_deps = {s.id: len(s.dependencies) for s in graph.subtasks}
+        dependents: dict[int, list[int]] = defaultdict(list)
+        for s in graph.subtasks:
+            for dep in s.dependencies:
+                dependents[dep].append(s.id)
+
+        with ThreadPoolExecutor(max_workers=_MAX_PARALLEL_SUBTASKS) as pool:
+            running = {
+                pool.submit(run_subtask, sid): sid
+                for sid in order
+                if sid != final_id and remaining_deps[sid] == 0
+            }
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    sid = running.pop(fut)
+                    fut.result()
+                    for child in dependents[sid]:
+                        remaining_deps[child] -= 1
+                        if remaining_deps[child] == 0 and child != final_id:
+                            running[pool.submit(run_subtask, child)] = child
+
+        if final_id is not None:
+            run_subtask(final_id)
+
         deliverable_parts = [outputs[sid] for sid in order
                              if sid in outputs and outputs[sid]]
         full_deliverable = "\n\n".join(deliverable_parts) if deliverable_parts else ""
@@ -394,21 +631,34 @@ def _run_pyrrhus(client: genai.Client, task: str, graph: TaskGraph,
 # ---------------------------------------------------------------------------
 
 def _run_baseline(client: genai.Client, task: str, budget_dollars: float,
-                  mode: str, event_queue: queue.Queue) -> None:
+                  mode: str, event_queue: _EventChannel) -> None:
     try:
         model = TIER_MODELS[Tier.DEEP]
         tier = Tier.DEEP
 
+        price_out = TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
+
         config_kwargs: dict = {"temperature": 0.4}
         if mode == "capped":
-            price_per_token = TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
-            max_tokens = int(budget_dollars / price_per_token) if price_per_token > 0 else 8192
+            max_tokens = int(budget_dollars / price_out) if price_out > 0 else 8192
             max_tokens = max(256, min(max_tokens, 65536))
             config_kwargs["max_output_tokens"] = max_tokens
 
-        output_chunks: list[str] = []
+        output_buf = bytearray()
         est_output_tokens = 0
         last_chunk = None
+        pending = _DeltaBuffer()
+
+        def flush_pending() -> None:
+            est_cost = est_output_tokens * price_out
+            event_queue.put({
+                "type": "baseline_chunk",
+                "data": {
+                    "delta": pending.take(),
+                    "tokens_so_far": est_output_tokens,
+                    "cost_so_far": round(est_cost, 8),
+                },
+            })
 
         for chunk in client.models.generate_content_stream(
             model=model,
@@ -418,19 +668,14 @@ def _run_baseline(client: genai.Client, task: str, budget_dollars: float,
             last_chunk = chunk
             delta = chunk.text or ""
             if delta:
-                output_chunks.append(delta)
+                output_buf.extend(delta.encode("utf-8"))
                 est_output_tokens += max(1, len(delta) // 4)
-                est_cost = est_output_tokens * TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
-                event_queue.put({
-                    "type": "baseline_chunk",
-                    "data": {
-                        "delta": delta,
-                        "tokens_so_far": est_output_tokens,
-                        "cost_so_far": round(est_cost, 8),
-                    },
-                })
-
-        full_output = "".join(output_chunks)
+                if pending.add(delta):
+                    flush_pending()
+        if pending:
+            flush_pending()
+
+        full_output = output_buf.decode("utf-8")
 
         prompt_tokens = 0
         completion_tokens = est_output_tokens
@@ -441,7 +686,7 @@ def _run_baseline(client: genai.Client, task: str, budget_dollars: float,
 
         total_cost = (
             prompt_tokens * TIER_PRICING_PER_1M_INPUT[tier] / 1_000_000
-            + completion_tokens * TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
+            + completion_tokens * price_out
         )
 
         event_queue.put({
@@ -466,6 +711,22 @@ def _run_baseline(client: genai.Client, task: str, budget_dollars: float,
 # SSE endpoint
 # ---------------------------------------------------------------------------
 
+# Reuse the planner across requests instead of rebuilding it per stream; its
+# genai client is the pooled one from llm_provider.
+_shared_lock = threading.Lock()
+_planners: dict[str, PlannerAgent] = {}
+
+
+def _get_planner(api_key: str) -> PlannerAgent:
+    planner = _planners.get(api_key)
+    if planner is None:
+        with _shared_lock:
+            planner = _planners.get(api_key)
+            if planner is None:
+                planner = _planners[api_key] = PlannerAgent(api_key=api_key)
+    return planner
+
+
 @compare_bp.route("/api/compare/stream")
 def compare_stream():
     task = request.args.get("task", "").strip()
@@ -481,9 +742,9 @@ def compare_stream():
                         mimetype="text/event-stream")
 
     def generate():
-        client = genai.Client(api_key=api_key)
+        client = get_genai_client(api_key)
 
-        planner = PlannerAgent(api_key=api_key)
+        planner = _get_planner(api_key)
         planner_result = planner.plan(task)
         pc = _planner_cost(
             planner_result.usage.prompt_tokens,
@@ -503,7 +764,7 @@ def compare_stream():
             "mode": "dynamic_roi",
         })
 
-        event_q: queue.Queue = queue.Queue()
+        event_q = _EventChannel()
 
         pyrrhus_thread = threading.Thread(
             target=_run_pyrrhus,
@@ -525,26 +786,36 @@ def compare_stream():
         pyrrhus_cost = 0.0
         baseline_cost = 0.0
 
+        last_event = time.monotonic()
         while len(done_sides) < 2:
-            try:
-                evt = event_q.get(timeout=120)
-            except queue.Empty:
-                yield _sse("error", {"message": "Timeout waiting for results"})
-                return
-
-            if evt["type"] == "thread_done":
-                side = evt["side"]
-                done_sides.add(side)
-                if side == "pyrrhus":
-                    pyrrhus_deliverable = evt.get("deliverable", "")
-                    pyrrhus_cost = evt.get("total_cost", 0)
+            events = event_q.drain(timeout=_EVENT_WAIT_SECONDS)
+            if not events:
+                workers_alive = pyrrhus_thread.is_alive() or baseline_thread.is_alive()
+                if (not workers_alive
+                        or time.monotonic() - last_event > _STREAM_IDLE_TIMEOUT):
+                    yield _sse("error", {"message": "Timeout waiting for results"})
+                    return
+                continue
+            last_event = time.monotonic()
+
+            # One write per drained batch rather than one per event.
+            buf: list[bytes] = []
+            for evt in events:
+                if evt["type"] == "thread_done":
+                    side = evt["side"]
+                    done_sides.add(side)
+                    if side == "pyrrhus":
+                        pyrrhus_deliverable = evt.get("deliverable", "")
+                        pyrrhus_cost = evt.get("total_cost", 0)
+                    else:
+                        baseline_deliverable = evt.get("deliverable", "")
+                        baseline_cost = evt.get("total_cost", 0)
+                elif evt["type"] == "error":
+                    buf.append(_sse("error", evt["data"]))
                 else:
-                    baseline_deliverable = evt.get("deliverable", "")
-                    baseline_cost = evt.get("total_cost", 0)
-            elif evt["type"] == "error":
-                yield _sse("error", evt["data"])
-            else:
-                yield _sse(evt["type"], evt["data"])
+                    buf.append(_sse(evt["type"], evt["data"]))
+            if buf:
+                yield b"".join(buf)
 
         pyrrhus_q = _evaluate(client, task, pyrrhus_deliverable) if pyrrhus_deliverable else None
         baseline_q = _evaluate(client, task, baseline_deliverable) if baseline_deliverable else None
@@ -568,12 +839,15 @@ def compare_stream():
             "budget": budget,
         })
 
-    return Response(
-        generate(),
-        mimetype="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "X-Accel-Buffering": "no",
-            "Connection": "keep-alive",
-        },
-    )
+    headers = {
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",
+        "Connection": "keep-alive",
+        "Vary": "Accept-Encoding",
+    }
+    body = generate()
+    if request.accept_encodings["gzip"] > 0:
+        body = _gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+
+    return Response(body, mimetype="text/event-stream", headers=headers)
@@ -19,9 +19,12 @@ plt.rcParams.update({
     "axes.facecolor": "white",
     "savefig.facecolor": "white",
     "savefig.bbox": "tight",
-    "savefig.dpi": 200,
+    "savefig.dpi": 150,
 })
 
+# Routed through Pillow so the PNGs get an optimizing encoder pass.
+PNG_KWARGS = {"optimize": True, "compress_level": 6}
+
 COLORS = {
     "fast": "#22c55e",
     "verify": "#eab308",
@@ -32,14 +35,16 @@ COLORS = {
 }
 
 
-def fig2_tier_costs():
+def fig2_tier_costs(fig):
     """Bar chart comparing per-tier output costs."""
     tiers = ["Fast\ngemini-2.5-flash-lite", "Verify\ngemini-2.5-flash", "Deep\ngemini-2.5-pro"]
     input_costs = [0.10, 0.15, 1.25]
     output_costs = [0.40, 0.60, 10.00]
     colors = [COLORS["fast"], COLORS["verify"], COLORS["deep"]]
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4.5))
+    fig.clear()
+    fig.set_size_inches(10, 4.5)
+    ax1, ax2 = fig.subplots(1, 2)
 
     bars1 = ax1.bar(tiers, input_costs, color=colors, width=0.55, edgecolor="white", linewidth=1.5)
     ax1.set_ylabel("Cost per 1M tokens ($)")
@@ -63,19 +68,20 @@ def fig2_tier_costs():
 
     fig.suptitle("Tier Cost Comparison", fontsize=14, fontweight="bold", y=1.02)
     fig.tight_layout()
-    fig.savefig(OUT / "fig2_tier_costs.png")
-    plt.close(fig)
+    fig.savefig(OUT / "fig2_tier_costs.png", pil_kwargs=PNG_KWARGS)
     print("  fig2_tier_costs.png")
 
 
-def fig5_budget_quality():
+def fig5_budget_quality(fig):
     """Budget vs quality frontier curve with example data."""
     budgets = [0.005, 0.01, 0.02, 0.04, 0.08, 0.12, 0.16]
     pyrrhus_quality = [4.2, 5.8, 6.9, 7.4, 7.8, 8.0, 8.1]
     deep_only_quality = [None, None, 5.5, 6.8, 7.5, 7.9, 8.2]
     pyrrhus_cost = [0.003, 0.007, 0.014, 0.028, 0.052, 0.068, 0.078]
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig.clear()
+    fig.set_size_inches(8, 5)
+    ax = fig.subplots()
 
     ax.plot(budgets, pyrrhus_quality, "o-", color=COLORS["pyrrhus"],
             linewidth=2.5, markersize=8, label="Pyrrhus (tiered routing)", zorder=5)
@@ -105,29 +111,30 @@ def fig5_budget_quality():
                 bbox=dict(boxstyle="round,pad=0.3", facecolor="white", edgecolor="#ddd"))
 
     fig.tight_layout()
-    fig.savefig(OUT / "fig5_budget_quality.png")
-    plt.close(fig)
+    fig.savefig(OUT / "fig5_budget_quality.png", pil_kwargs=PNG_KWARGS)
     print("  fig5_budget_quality.png")
 
 
-def fig6_cost_comparison():
+def fig6_cost_comparison(fig):
     """Side-by-side cost comparison: Pyrrhus vs Deep-only baseline."""
     subtasks = ["Research\nstartups", "Summarize\nfindings", "Identify\ntrends", "Write\nblog post", "Review\nquality"]
     pyrrhus_tiers = ["fast", "fast", "verify", "deep", "fast"]
-    pyrrhus_costs = [0.0008, 0.0012, 0.0025, 0.0180, 0.0005]
-    deep_costs = [0.0120, 0.0150, 0.0200, 0.0250, 0.0100]
+    pyrrhus_costs = np.asarray([0.0008, 0.0012, 0.0025, 0.0180, 0.0005])
+    deep_costs = np.asarray([0.0120, 0.0150, 0.0200, 0.0250, 0.0100])
 
     tier_colors = [COLORS[t] for t in pyrrhus_tiers]
 
-    fig, ax = plt.subplots(figsize=(10, 5))
+    fig.clear()
+    fig.set_size_inches(10, 5)
+    ax = fig.subplots()
 
     x = np.arange(len(subtasks))
     width = 0.35
 
-    bars_deep = ax.bar(x - width/2, [c * 1000 for c in deep_costs], width,
+    bars_deep = ax.bar(x - width/2, deep_costs * 1000, width,
                        color=COLORS["baseline"], alpha=0.5, label="Deep-only baseline",
                        edgecolor="white", linewidth=1.5)
-    bars_pyrrhus = ax.bar(x + width/2, [c * 1000 for c in pyrrhus_costs], width,
+    bars_pyrrhus = ax.bar(x + width/2, pyrrhus_costs * 1000, width,
                           color=tier_colors, edgecolor="white", linewidth=1.5)
 
     for bar, tier in zip(bars_pyrrhus, pyrrhus_tiers):
@@ -142,9 +149,9 @@ def fig6_cost_comparison():
     ax.set_xticklabels(subtasks, fontsize=9)
     ax.grid(True, axis="y", alpha=0.2)
 
-    pyrrhus_total = sum(pyrrhus_costs) * 1000
-    deep_total = sum(deep_costs) * 1000
-    savings_pct = (1 - sum(pyrrhus_costs) / sum(deep_costs)) * 100
+    pyrrhus_total = pyrrhus_costs.sum() * 1000
+    deep_total = deep_costs.sum() * 1000
+    savings_pct = (1 - pyrrhus_costs.sum() / deep_costs.sum()) * 100
 
     legend_elements = [
         mpatches.Patch(facecolor=COLORS["baseline"], alpha=0.5, label=f"Deep-only (${deep_total:.1f}×10⁻³ total)"),
@@ -160,25 +167,21 @@ def fig6_cost_comparison():
             bbox=dict(boxstyle="round,pad=0.4", facecolor="#f0fdf4", edgecolor=COLORS["savings"], alpha=0.9))
 
     fig.tight_layout()
-    fig.savefig(OUT / "fig6_cost_comparison.png")
-    plt.close(fig)
+    fig.savefig(OUT / "fig6_cost_comparison.png", pil_kwargs=PNG_KWARGS)
     print("  fig6_cost_comparison.png")
 
 
-def fig7_surplus_redistribution():
+def fig7_surplus_redistribution(fig):
     """Stacked area chart showing surplus flow across subtasks."""
     subtasks = ["S1: Research", "S2: Summarize", "S3: Trends", "S4: Write", "S5: Review"]
-    budgeted = [2048, 2048, 4096, 8192, 2048]
-    consumed = [800, 1400, 2800, 5200, 1200]
-    surplus_generated = [b - c for b, c in zip(budgeted, consumed)]
-
-    cumulative_surplus = []
-    pool = 0
-    for s in surplus_generated:
-        pool += s
-        cumulative_surplus.append(pool)
+    budgeted = np.asarray([2048, 2048, 4096, 8192, 2048])
+    consumed = np.asarray([800, 1400, 2800, 5200, 1200])
+    surplus_generated = budgeted - consumed
+    cumulative_surplus = np.cumsum(surplus_generated)
 
-    fig, ax = plt.subplots(figsize=(9, 5))
+    fig.clear()
+    fig.set_size_inches(9, 5)
+    ax = fig.subplots()
 
     x = np.arange(len(subtasks))
     width = 0.6
@@ -207,20 +210,21 @@ def fig7_surplus_redistribution():
     ax.legend(lines1 + lines2, labels1 + labels2, loc="upper left", fontsize=9, framealpha=0.9)
 
     fig.tight_layout()
-    fig.savefig(OUT / "fig7_surplus.png")
-    plt.close(fig)
+    fig.savefig(OUT / "fig7_surplus.png", pil_kwargs=PNG_KWARGS)
     print("  fig7_surplus.png")
 
 
-def fig8_text_metrics():
+def fig8_text_metrics(fig):
     """Multi-panel chart showing text quality metrics across budget levels."""
     budgets = [0.01, 0.02, 0.04, 0.08, 0.16]
     ttr = [0.52, 0.56, 0.61, 0.63, 0.64]
     compression = [0.38, 0.35, 0.32, 0.30, 0.29]
-    ngram_rep = [0.18, 0.14, 0.10, 0.08, 0.07]
+    ngram_rep = np.asarray([0.18, 0.14, 0.10, 0.08, 0.07])
     filler_count = [8, 5, 3, 2, 1]
 
-    fig, axes = plt.subplots(2, 2, figsize=(10, 7))
+    fig.clear()
+    fig.set_size_inches(10, 7)
+    axes = fig.subplots(2, 2)
 
     for ax in axes.flat:
         ax.grid(True, alpha=0.2)
@@ -241,12 +245,12 @@ def fig8_text_metrics():
     ax2.fill_between(budgets, compression, alpha=0.08, color="#f97316")
 
     ax3 = axes[1, 0]
-    ax3.plot(budgets, [r * 100 for r in ngram_rep], "^-", color=COLORS["deep"], linewidth=2, markersize=7)
+    ax3.plot(budgets, ngram_rep * 100, "^-", color=COLORS["deep"], linewidth=2, markersize=7)
     ax3.set_title("Structural Repetition", fontweight="bold", fontsize=11)
     ax3.set_ylabel("N-gram Repetition (%)")
     ax3.set_xlabel("Budget ($)")
     ax3.set_ylim(4, 22)
-    ax3.fill_between(budgets, [r * 100 for r in ngram_rep], alpha=0.08, color=COLORS["deep"])
+    ax3.fill_between(budgets, ngram_rep * 100, alpha=0.08, color=COLORS["deep"])
 
     ax4 = axes[1, 1]
     ax4.bar(budgets, filler_count, width=0.012, color=COLORS["verify"], alpha=0.7,
@@ -258,16 +262,24 @@ def fig8_text_metrics():
 
     fig.suptitle("Text Quality Metrics vs. Budget", fontsize=14, fontweight="bold", y=1.02)
     fig.tight_layout()
-    fig.savefig(OUT / "fig8_text_metrics.png")
-    plt.close(fig)
+    fig.savefig(OUT / "fig8_text_metrics.png", pil_kwargs=PNG_KWARGS)
     print("  fig8_text_metrics.png")
 
 
+FIGURES = [
+    fig2_tier_costs,
+    fig5_budget_quality,
+    fig6_cost_comparison,
+    fig7_surplus_redistribution,
+    fig8_text_metrics,
+]
+
+
 if __name__ == "__main__":
     print("Generating white paper figures...")
-    fig2_tier_costs()
-    fig5_budget_quality()
-    fig6_cost_comparison()
-    fig7_surplus_redistribution()
-    fig8_text_metrics()
+    # One Figure, cleared and redrawn for each figure, so the Agg
+    # canvas/renderer is only set up once.
+    fig = plt.figure()
+    for draw in FIGURES:
+        draw(fig)
     print("Done.")
@@ -6,9 +6,23 @@ swapped between providers (Gemini, Anthropic) without changing agent code.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import logging
 import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from itertools import chain, groupby
+from operator import itemgetter, methodcaller
+from pathlib import Path
 from typing import List, Optional
 
+import httpx
+from google import genai
 from google.genai import types
 
 from CAL.llm import LLM, GeminiLLM
@@ -18,6 +32,193 @@ from CAL.tool import Tool
 
 from models import TIER_MAX_TOKENS, TIER_MODELS, Tier
 
+logger = logging.getLogger(__name__)
+
+# With cache_responses on, identical requests reuse the earlier response
+# instead of paying for another round-trip.
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE: OrderedDict[str, Message] = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+# They also persist on disk so re-running the
+# same task during development does not pay for the same calls again.
+RESPONSE_CACHE_DIR = Path(
+    os.getenv("PYRRHUS_CACHE_DIR", Path.home() / ".cache" / "pyrrhus")
+) / "responses"
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 3600
+RESPONSE_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _response_cache_key(
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    system_prompt: str,
+    conversation_history: List[Message],
+) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{model}|{temperature}|{max_tokens}|{system_prompt}".encode("utf-8"))
+    for message in conversation_history:
+        h.update(b"\0" + message.role.value.encode("utf-8"))
+        blocks = ([message.content] if isinstance(message.content, str)
+                  else message.content)
+        for block in blocks:
+            text = block if isinstance(block, str) else getattr(block, "text", repr(block))
+            h.update(b"\0" + text.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _remember_response(cache_key: str, message: Message) -> None:
+    with _response_cache_lock:
+        _RESPONSE_CACHE[cache_key] = message
+        _RESPONSE_CACHE.move_to_end(cache_key)
+        while len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
+def _response_cache_path(cache_key: str) -> Path:
+    return RESPONSE_CACHE_DIR / cache_key[:2] / f"{cache_key}.json"
+
+
+def _load_disk_response(cache_key: str) -> Optional[dict]:
+    """Return the cached ``{text, prompt_tokens, completion_tokens}`` entry,
+    or None if missing/expired/corrupt."""
+    path = _response_cache_path(cache_key)
+    try:
+        if time.time() - path.stat().st_mtime > RESPONSE_CACHE_TTL_SECONDS:
+            path.unlink(missing_ok=True)
+            return None
+        entry = json.loads(path.read_bytes())
+        if not isinstance(entry.get("text"), str):
+            raise ValueError("entry has no response text")
+        os.utime(path)  # refresh for LRU eviction
+        return entry
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.warning("Ignoring unreadable response cache entry %s", path, exc_info=True)
+        return None
+
+
+def _store_disk_response(cache_key: str, text: str, usage: dict) -> None:
+    """Atomically write a response, then evict least-recently-used entries
+    while the cache is over its size cap."""
+    path = _response_cache_path(cache_key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({
+                    "text": text,
+                    "prompt_tokens": usage.get("prompt_tokens", 0),
+                    "completion_tokens": usage.get("completion_tokens", 0),
+                }, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+        entries = sorted(
+            (e.stat().st_mtime, e.stat().st_size, e)
+            for e in RESPONSE_CACHE_DIR.glob("*/*.json")
+        )
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= RESPONSE_CACHE_MAX_BYTES:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
+    except Exception:
+        logger.warning("Could not write response cache entry %s", path, exc_info=True)
+
+
+_ROLE_MAP = {"tool response": "user", "assistant": "model"}
+_to_gemini = methodcaller("gemini_content_form")
+
+
+def _blocks_to_parts(content) -> list:
+    if isinstance(content, str):
+        return [TextBlock(content).gemini_content_form()]
+    parts = []
+    for gemini_block in map(_to_gemini, content):
+        if isinstance(gemini_block, list):
+            parts.extend(gemini_block)
+        else:
+            parts.append(gemini_block)
+    return parts
+
+
+def _format_history(conversation_history: List[Message]) -> list[dict]:
+    """Convert CAL messages into Gemini ``contents``, merging same-role turns."""
+    pairs = [
+        (_ROLE_MAP.get(m.role.value, m.role.value), _blocks_to_parts(m.content))
+        for m in conversation_history
+    ]
+    return [
+        {"role": role, "parts": list(chain.from_iterable(p for _, p in group))}
+        for role, group in groupby(pairs, key=itemgetter(0))
+    ]
+
+
+_clients_lock = threading.Lock()
+_clients: dict[str, genai.Client] = {}
+
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:  # optional: httpx only speaks HTTP/2 with h2 installed
+    _HTTP2 = False
+
+_MAX_CONNECTIONS = 32
+# Match the client CAL's GeminiLLM builds, so a stalled request fails
+# instead of blocking an executor layer or batch worker forever.
+_API_VERSION = "v1alpha"
+_TIMEOUT_MS = 20_000
+
+
+def _http_options() -> types.HttpOptions:
+    """Pooled keep-alive transport shared by every tier and batch worker."""
+    return types.HttpOptions(
+        api_version=_API_VERSION,
+        timeout=_TIMEOUT_MS,
+        headers={"Connection": "keep-alive"},
+        client_args={
+            "http2": _HTTP2,
+            "limits": httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_CONNECTIONS,
+            ),
+        },
+    )
+
+
+def get_genai_client(api_key: str) -> genai.Client:
+    """One ``genai.Client`` per API key, so every tier (and the planner and
+    evaluator) shares its connection pool instead of opening its own."""
+    client = _clients.get(api_key)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(api_key)
+            if client is None:
+                client = _clients[api_key] = genai.Client(
+                    api_key=api_key, http_options=_http_options(),
+                )
+    return client
+
+
+def warm_up(api_key: str) -> None:
+    """Open a pooled connection on the shared client before the first tier call.
+
+    A model metadata lookup is free, so running this alongside the planner
+    moves the TLS handshake off the critical path. Best effort: failures are
+    logged and otherwise ignored.
+    """
+    try:
+        get_genai_client(api_key).models.get(model=TIER_MODELS[Tier.FAST])
+    except Exception:
+        logger.debug("Client warm-up failed", exc_info=True)
+
 
 class BudgetGeminiLLM(GeminiLLM):
     """GeminiLLM subclass that passes ``temperature`` and ``max_output_tokens``
@@ -30,13 +231,25 @@ class BudgetGeminiLLM(GeminiLLM):
         model: str,
         max_tokens: int,
         temperature: float = 0.4,
+        cache_responses: bool = False,
+        client: Optional[genai.Client] = None,
     ):
-        super().__init__(
-            api_key=api_key,
-            model=model,
-            max_tokens=max_tokens,
-        )
+        if client is None:
+            super().__init__(
+                api_key=api_key,
+                model=model,
+                max_tokens=max_tokens,
+            )
+        else:
+            # GeminiLLM.__init__ would build a genai.Client of its own only
+            # for it to be replaced; set the same attributes around it.
+            LLM.__init__(self, max_tokens, name=model, provider="Gemini")
+            self.api_key = api_key
+            self.model = model
+            self.thinking_level = None
+            self.client = client
         self.temperature = temperature
+        self.cache_responses = cache_responses
 
     def generate_content(
         self,
@@ -44,116 +257,160 @@ class BudgetGeminiLLM(GeminiLLM):
         conversation_history: List[Message],
         tools: Optional[List[Tool]] = None,
     ) -> Message:
-        formatted_history = []
-        for message in conversation_history:
-            parts = []
-            if isinstance(message.content, str):
-                parts.append(TextBlock(message.content).gemini_content_form())
-            else:
-                for block in message.content:
-                    gemini_block = block.gemini_content_form()
-                    parts.extend(
-                        gemini_block
-                        if isinstance(gemini_block, list)
-                        else [gemini_block]
+        cache_key = None
+        if tools is None and self.cache_responses:
+            cache_key = _response_cache_key(
+                self.model, self.temperature, self.max_tokens,
+                system_prompt, conversation_history,
+            )
+            with _response_cache_lock:
+                cached = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(cache_key)
+            if cached is None:
+                entry = _load_disk_response(cache_key)
+                if entry is not None:
+                    prompt_tokens = entry.get("prompt_tokens", 0)
+                    completion_tokens = entry.get("completion_tokens", 0)
+                    cached = Message(
+                        role=MessageRole.ASSISTANT,
+                        content=[TextBlock(text=entry["text"])],
+                        usage={
+                            "prompt_tokens": prompt_tokens,
+                            "completion_tokens": completion_tokens,
+                            "total_tokens": prompt_tokens + completion_tokens,
+                        },
+                        metadata={},
                     )
-
-            role = message.role.value
-            if role == "tool response":
-                role = "user"
-            elif role == "assistant":
-                role = "model"
-
-            if formatted_history and formatted_history[-1]["role"] == role:
-                formatted_history[-1]["parts"].extend(parts)
-            else:
-                formatted_history.append({"role": role, "parts": parts})
+                    _remember_response(cache_key, cached)
+            if cached is not None:
+                # Keep the original usage for surplus accounting; callers
+                # check cache_hit and bill the reused response at $0.
+                return Message(
+                    role=cached.role,
+                    content=copy.deepcopy(cached.content),
+                    usage=dict(cached.usage or {}),
+                    metadata={**(cached.metadata or {}), "cache_hit": True},
+                )
 
         config_params: dict = {
             "system_instruction": system_prompt,
             "temperature": self.temperature,
             "max_output_tokens": self.max_tokens,
         }
-
         if tools:
             config_params["tools"] = [tool.gemini_input_form() for tool in tools]
 
         response = self.client.models.generate_content(
             model=self.model,
-            contents=formatted_history,
+            contents=_format_history(conversation_history),
             config=types.GenerateContentConfig(**config_params),
         )
 
-        content_blocks = []
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if candidate.content and candidate.content.parts:
-                for part in candidate.content.parts:
-                    if hasattr(part, "text") and part.text:
-                        content_blocks.append(TextBlock(text=part.text))
-
-        usage = {}
-        if hasattr(response, "usage_metadata") and response.usage_metadata:
-            usage = {
-                "prompt_tokens": getattr(
-                    response.usage_metadata, "prompt_token_count", 0
-                )
-                or 0,
-                "completion_tokens": getattr(
-                    response.usage_metadata, "candidates_token_count", 0
-                )
-                or 0,
-                "total_tokens": getattr(
-                    response.usage_metadata, "total_token_count", 0
-                )
-                or 0,
-            }
+        cand = response.candidates[0] if response.candidates else None
+        text = ""
+        if cand and cand.content and cand.content.parts:
+            text = "\n".join(
+                part.text for part in cand.content.parts
+                if getattr(part, "text", None)
+            )
+        metadata = (
+            {"finish_reason": str(cand.finish_reason)}
+            if cand and cand.finish_reason else {}
+        )
 
-        finish_reason = None
-        if response.candidates and len(response.candidates) > 0:
-            candidate = response.candidates[0]
-            if hasattr(candidate, "finish_reason"):
-                finish_reason = str(candidate.finish_reason)
+        um = getattr(response, "usage_metadata", None)
+        usage = {
+            "prompt_tokens": um.prompt_token_count or 0,
+            "completion_tokens": um.candidates_token_count or 0,
+            "total_tokens": um.total_token_count or 0,
+        } if um else {}
 
-        return Message(
+        content_blocks = [TextBlock(text=text)] if text else []
+        message = Message(
             role=MessageRole.ASSISTANT,
             content=content_blocks,
             usage=usage,
-            metadata={"finish_reason": finish_reason} if finish_reason else {},
+            metadata=metadata,
         )
 
+        if cache_key is not None and content_blocks:
+            _remember_response(cache_key, message)
+            _store_disk_response(cache_key, text, usage)
+
+        return message
+
 
 # -----------------------------------------------------------------------
 # Factory
 # -----------------------------------------------------------------------
 
 
+class _LazyTierLLMs(Mapping):
+    """``{Tier: LLM}`` mapping that builds each tier's LLM on first access."""
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._llms: dict[Tier, LLM] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, tier: Tier) -> LLM:
+        llm = self._llms.get(tier)
+        if llm is None:
+            if tier not in TIER_MODELS:
+                raise KeyError(tier)
+            with self._lock:
+                llm = self._llms.get(tier)
+                if llm is None:
+                    llm = self._llms[tier] = self._factory(tier)
+        return llm
+
+    def __iter__(self):
+        return iter(Tier)
+
+    def __len__(self) -> int:
+        return len(Tier)
+
+
 def create_tier_llms(
     api_key: str,
     provider: str = "gemini",
     temperature: float = 0.4,
-) -> dict[Tier, LLM]:
+    cache_responses: Optional[bool] = None,
+) -> Mapping[Tier, LLM]:
     """Create one LLM instance per execution tier.
 
+    Instances are built lazily, on first lookup of their tier, and share a
+    single ``genai.Client`` per API key.
+
     Args:
         api_key: Provider API key.
         provider: ``"gemini"`` (default) or ``"anthropic"`` (stub).
         temperature: Sampling temperature for all tiers.
+        cache_responses: Reuse responses to identical requests, in memory
+            and on disk across runs. Defaults to the
+            ``PYRRHUS_CACHE_RESPONSES`` env var.
 
     Returns:
-        A ``{Tier: LLM}`` dict ready to hand to ``ExecutorAgent`` or
+        A ``{Tier: LLM}`` mapping ready to hand to ``ExecutorAgent`` or
         ``DynamicExecutor``.
     """
+    if cache_responses is None:
+        cache_responses = os.getenv("PYRRHUS_CACHE_RESPONSES", "") == "1"
     if provider == "gemini":
-        return {
-            tier: BudgetGeminiLLM(
+        client = get_genai_client(api_key)
+
+        def _make(tier: Tier) -> LLM:
+            return BudgetGeminiLLM(
                 api_key=api_key,
                 model=TIER_MODELS[tier],
                 max_tokens=TIER_MAX_TOKENS[tier],
                 temperature=temperature,
+                cache_responses=cache_responses,
+                client=client,
             )
-            for tier in Tier
-        }
+
+        return _LazyTierLLMs(_make)
 
     raise ValueError(f"Unsupported provider: {provider!r}")
 
@@ -169,15 +426,20 @@ def extract_response(msg: Message) -> tuple[str, int, int, int]:
     Returns:
         ``(text, prompt_tokens, completion_tokens, total_tokens)``
     """
-    text_parts: list[str] = []
-    if isinstance(msg.content, list):
-        for block in msg.content:
-            if isinstance(block, TextBlock):
-                text_parts.append(block.text)
-    elif isinstance(msg.content, str):
-        text_parts.append(msg.content)
-
-    text = "\n".join(text_parts) if text_parts else ""
+    content = msg.content
+    if type(content) is list and all(type(b) is TextBlock for b in content):
+        # Fast path: BudgetGeminiLLM only ever produces TextBlocks.
+        text = "\n".join(b.text for b in content)
+    else:
+        text_parts: list[str] = []
+        if isinstance(content, list):
+            for block in content:
+                if isinstance(block, TextBlock):
+                    text_parts.append(block.text)
+        elif isinstance(content, str):
+            text_parts.append(content)
+
+        text = "\n".join(text_parts) if text_parts else ""
 
     usage = msg.usage or {}
     return (
@@ -188,6 +450,11 @@ def extract_response(msg: Message) -> tuple[str, int, int, int]:
     )
 
 
+def is_cache_hit(msg: Message) -> bool:
+    """True if ``msg`` was served from the response cache (costs nothing)."""
+    return bool((msg.metadata or {}).get("cache_hit"))
+
+
 def make_user_message(prompt: str) -> Message:
     """Wrap a plain prompt string into a CAL user ``Message``."""
     return Message(
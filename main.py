@@ -11,7 +11,9 @@ import argparse
 import logging
 import os
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from dotenv import load_dotenv
 
@@ -21,24 +23,59 @@ from agents.planner import PlannerAgent
 from analysis.text_metrics import compute_text_metrics
 from analysis.trace_store import save_trace
 from batch_runner import run_batch
-from llm_provider import create_tier_llms
+from llm_provider import create_tier_llms, warm_up
 from models import (
     TIER_PRICING_PER_1M_INPUT,
     TIER_PRICING_PER_1M_OUTPUT,
     PlannerTrace,
+    QualityScore,
     RunTrace,
+    SubTaskResult,
     SubTaskTrace,
+    TaskGraph,
+    TextMetrics,
     Tier,
 )
 
 load_dotenv()
 
+_EVAL_WORKERS = 8
+
+# Deliverables this short or repetitive are broken; judging them adds nothing.
+_EVAL_MIN_WORDS = int(os.getenv("EVAL_MIN_WORDS", "50"))
+_EVAL_MAX_NGRAM_REPETITION = 0.5
+
+
+# The planner always runs at VERIFY pricing.
+_VERIFY_IN = TIER_PRICING_PER_1M_INPUT[Tier.VERIFY] / 1_000_000
+_VERIFY_OUT = TIER_PRICING_PER_1M_OUTPUT[Tier.VERIFY] / 1_000_000
+
 
 def _planner_cost_dollars(prompt_tokens: int, completion_tokens: int) -> float:
-    tier = Tier.VERIFY
-    inp = prompt_tokens * TIER_PRICING_PER_1M_INPUT[tier] / 1_000_000
-    out = completion_tokens * TIER_PRICING_PER_1M_OUTPUT[tier] / 1_000_000
-    return inp + out
+    return prompt_tokens * _VERIFY_IN + completion_tokens * _VERIFY_OUT
+
+
+def _is_degenerate(metrics: TextMetrics | None) -> bool:
+    return (
+        metrics is None
+        or metrics.word_count < _EVAL_MIN_WORDS
+        or metrics.ngram_repetition_rate >= _EVAL_MAX_NGRAM_REPETITION
+    )
+
+
+def _write_lines(lines: list[str]) -> None:
+    """Emit a report section with one write instead of a print per line."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _subtask_lines(graph: TaskGraph) -> list[str]:
+    lines = []
+    for st in graph.subtasks:
+        deps = f"  deps: {st.dependencies}" if st.dependencies else ""
+        lines.append(f"  [{st.id}] [{st.complexity.value:<6}] {st.description}{deps}")
+    return lines
 
 
 def _parse_args() -> argparse.Namespace:
@@ -73,13 +110,15 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
     print(f"Task:   {task}")
     print(f"Budget: ${budget:.4f}")
     print()
-    t0 = time.time()
+    t0 = time.perf_counter()
 
     # ── Step 1: Plan ─────────────────────────────────────────────────────
     print("=" * 64)
     print("STEP 1 — PLANNER")
     print("=" * 64)
 
+    # Connect the executor's shared client while the planner is thinking.
+    threading.Thread(target=warm_up, args=(api_key,), daemon=True).start()
     planner = PlannerAgent(api_key=api_key)
     planner_result = planner.plan(task)
     planner_cost = _planner_cost_dollars(
@@ -87,9 +126,7 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
         planner_result.usage.completion_tokens,
     )
 
-    for st in planner_result.graph.subtasks:
-        deps = f"  deps: {st.dependencies}" if st.dependencies else ""
-        print(f"  [{st.id}] [{st.complexity.value:<6}] {st.description}{deps}")
+    _write_lines(_subtask_lines(planner_result.graph))
     print(f"\n  Planner cost: ${planner_cost:.6f}  "
           f"({planner_result.usage.total_tokens} total tokens)")
 
@@ -101,37 +138,55 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
 
     tier_llms = create_tier_llms(api_key=api_key)
     executor = DynamicExecutor(tier_llms=tier_llms, api_key=api_key)
-    result = executor.execute(
-        task=task,
-        graph=planner_result.graph,
-        budget_dollars=budget,
-        planner_cost_dollars=planner_cost,
-    )
+    evaluator = EvaluatorAgent(api_key=api_key) if evaluate else None
+
+    # Score each subtask as soon as the executor finishes it, so evaluation
+    # overlaps with execution of the subtasks that follow.
+    eval_pool = ThreadPoolExecutor(max_workers=_EVAL_WORKERS)
+    subtask_futures: dict[Future, int] = {}
+
+    def _score_subtask(sr: SubTaskResult) -> None:
+        if not sr.skipped and sr.output:
+            fut = eval_pool.submit(
+                evaluator.evaluate_subtask, sr.description, sr.output, task,
+            )
+            subtask_futures[fut] = sr.subtask_id
+
+    try:
+        result = executor.execute(
+            task=task,
+            graph=planner_result.graph,
+            budget_dollars=budget,
+            planner_cost_dollars=planner_cost,
+            on_subtask_done=_score_subtask if evaluator else None,
+        )
+    except BaseException:
+        eval_pool.shutdown(cancel_futures=True)
+        raise
     r = result.report
 
-    print()
+    lines = [""]
     for sr in r.subtask_results:
         attempts_str = " → ".join(
             f"{a.tier.value}({a.quality_score:.1f})" for a in sr.attempts
         )
-        print(
+        lines.append(
             f"  [{sr.subtask_id}] {sr.tier.value:<6} │ "
             f"attempts: {attempts_str} │ "
             f"${sr.cost_dollars:.6f}"
         )
 
     if r.roi_decisions:
-        print(f"\n  ROI Decisions:")
-        for d in r.roi_decisions:
-            print(
-                f"    • Subtask {d.subtask_id}: {d.current_tier.value} → "
-                f"{d.proposed_tier.value} | quality {d.current_quality:.1f} | "
-                f"ROI {d.roi:.0f} | {d.decision}"
-            )
+        lines.append(f"\n  ROI Decisions:")
+        lines.extend(
+            f"    • Subtask {d.subtask_id}: {d.current_tier.value} → "
+            f"{d.proposed_tier.value} | quality {d.current_quality:.1f} | "
+            f"ROI {d.roi:.0f} | {d.decision}"
+            for d in r.roi_decisions
+        )
+    _write_lines(lines)
 
     # ── Step 4: Evaluate & trace ─────────────────────────────────────────
-    evaluator = EvaluatorAgent(api_key=api_key) if evaluate else None
-
     planner_trace = PlannerTrace(
         task=task,
         model=planner_result.model,
@@ -142,17 +197,51 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
         graph_json=planner_result.graph.model_dump_json(),
     )
 
-    subtask_traces: list[SubTaskTrace] = []
-    for sr in r.subtask_results:
-        quality = None
-        if evaluator and not sr.skipped and sr.output:
+    # Text metrics are cheap regex/zlib passes over a handful of outputs, so
+    # they run inline while the remaining evaluations (independent LLM
+    # round-trips) finish on threads. The deliverable's are needed up front
+    # to gate its evaluation.
+    deliverable_metrics = (
+        compute_text_metrics(result.deliverable) if result.deliverable else None
+    )
+
+    subtask_quality: dict[int, QualityScore] = {}
+    deliverable_quality = None
+    deliverable_future = None
+    with eval_pool:
+        if evaluator and result.deliverable:
+            if _is_degenerate(deliverable_metrics):
+                deliverable_quality = QualityScore(
+                    relevance=0.0, completeness=0.0, coherence=0.0,
+                    conciseness=0.0, overall=0.0,
+                    rationale="skipped: degenerate output",
+                )
+            else:
+                deliverable_future = eval_pool.submit(
+                    evaluator.evaluate_deliverable, task, result.deliverable,
+                )
+        subtask_metrics = {
+            sr.subtask_id: compute_text_metrics(sr.output)
+            for sr in r.subtask_results
+            if sr.output
+        }
+        for fut, subtask_id in subtask_futures.items():
+            try:
+                subtask_quality[subtask_id] = fut.result()
+            except Exception:
+                pass
+        if deliverable_future is not None:
             try:
-                quality = evaluator.evaluate_subtask(sr.description, sr.output, task)
+                deliverable_quality = deliverable_future.result()
             except Exception:
                 pass
-        text_metrics = compute_text_metrics(sr.output) if sr.output else None
+
+    subtask_traces: list[SubTaskTrace] = []
+    for sr in r.subtask_results:
+        quality = subtask_quality.get(sr.subtask_id)
+        text_metrics = subtask_metrics.get(sr.subtask_id)
         subtask_traces.append(
-            SubTaskTrace(
+            SubTaskTrace.model_construct(
                 subtask_id=sr.subtask_id,
                 description=sr.description,
                 tier=sr.tier,
@@ -171,13 +260,6 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
             )
         )
 
-    deliverable_quality = None
-    if evaluator and result.deliverable:
-        try:
-            deliverable_quality = evaluator.evaluate_deliverable(task, result.deliverable)
-        except Exception:
-            pass
-
     trace = RunTrace(
         task=task,
         budget_dollars=budget,
@@ -190,71 +272,52 @@ def _run_single(api_key: str, task: str, budget: float, evaluate: bool) -> None:
     )
     save_trace(trace)
 
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
 
     # ── Cost Report ──────────────────────────────────────────────────────
-    print()
-    print("=" * 64)
-    print("COST REPORT")
-    print("=" * 64)
+    out: list[str] = []
+    out.append("")
+    out.append("=" * 64)
+    out.append("COST REPORT")
+    out.append("=" * 64)
 
-    print(f"\n  Budget Summary")
-    print(f"    Budget:      ${r.budget_dollars:.4f}")
-    print(f"    Spent:       ${r.spent_dollars:.6f}")
-    print(f"    Remaining:   ${r.remaining_dollars:.6f}")
-    print(f"    Utilization: {r.utilization_pct:.1f}%")
-
-    print(f"\n  Tier Distribution")
-    for tier_name, count in r.tier_counts.items():
-        if count > 0:
-            print(f"    {tier_name:<8} {count} subtask(s)")
-    print(f"    Upgrades: {r.total_upgrades}  │  Eval cost: ${r.evaluation_cost_dollars:.6f}")
-
-    print(f"\n  Efficiency")
-    print(f"    Tokens budgeted:  {r.total_tokens_budgeted:,}")
-    print(f"    Tokens consumed:  {r.total_tokens_consumed:,}")
-    print(f"    Total surplus:    {r.total_surplus:,}")
-    print(f"    Token efficiency: {r.token_efficiency_pct:.1f}%")
-
-    print(f"\n  Task Graph")
-    print(f"    Subtasks: {r.total_subtasks}  │  Max depth: {r.max_depth}  │  "
-          f"Parallelizable: {r.parallelizable_subtasks}")
-    print(f"    Complexity: {r.complexity_distribution}")
+    out.append(r.to_text())
 
     if deliverable_quality:
-        print(f"\n  Quality (LLM-as-judge)")
-        print(f"    Relevance:    {deliverable_quality.relevance:.1f}/10")
-        print(f"    Completeness: {deliverable_quality.completeness:.1f}/10")
-        print(f"    Coherence:    {deliverable_quality.coherence:.1f}/10")
-        print(f"    Conciseness:  {deliverable_quality.conciseness:.1f}/10")
-        print(f"    Overall:      {deliverable_quality.overall:.1f}/10")
-        print(f"    Rationale:    {deliverable_quality.rationale}")
+        out.append(f"\n  Quality (LLM-as-judge)")
+        out.append(f"    Relevance:    {deliverable_quality.relevance:.1f}/10")
+        out.append(f"    Completeness: {deliverable_quality.completeness:.1f}/10")
+        out.append(f"    Coherence:    {deliverable_quality.coherence:.1f}/10")
+        out.append(f"    Conciseness:  {deliverable_quality.conciseness:.1f}/10")
+        out.append(f"    Overall:      {deliverable_quality.overall:.1f}/10")
+        out.append(f"    Rationale:    {deliverable_quality.rationale}")
 
     if evaluator:
-        print(f"\n  Evaluation cost: ${evaluator.total_cost_dollars:.6f} "
-              f"({evaluator.total_tokens_used} tokens)")
+        out.append(f"\n  Evaluation cost: ${evaluator.total_cost_dollars:.6f} "
+                   f"({evaluator.total_tokens_used} tokens)")
 
     # Text metrics for the deliverable
-    if result.deliverable:
-        dm = compute_text_metrics(result.deliverable)
-        print(f"\n  Deliverable Text Metrics")
-        print(f"    Words:            {dm.word_count}")
-        print(f"    Type-token ratio: {dm.type_token_ratio:.3f}")
-        print(f"    Compression:      {dm.compression_ratio:.3f}")
-        print(f"    N-gram repeat:    {dm.ngram_repetition_rate:.3f}")
-        print(f"    Avg sent length:  {dm.avg_sentence_length:.1f} words")
-        print(f"    Filler phrases:   {dm.filler_phrase_count}")
-
-    print(f"\n  Wall time: {elapsed:.1f}s")
-    print(f"  Trace saved: {trace.run_id}")
+    dm = deliverable_metrics
+    if dm:
+        out.append(f"\n  Deliverable Text Metrics")
+        out.append(f"    Words:            {dm.word_count}")
+        out.append(f"    Type-token ratio: {dm.type_token_ratio:.3f}")
+        out.append(f"    Compression:      {dm.compression_ratio:.3f}")
+        out.append(f"    N-gram repeat:    {dm.ngram_repetition_rate:.3f}")
+        out.append(f"    Avg sent length:  {dm.avg_sentence_length:.1f} words")
+        out.append(f"    Filler phrases:   {dm.filler_phrase_count}")
+
+    out.append(f"\n  Wall time: {elapsed:.1f}s")
+    out.append(f"  Trace saved: {trace.run_id}")
 
     # ── Deliverable ──────────────────────────────────────────────────────
-    print()
-    print("=" * 64)
-    print("DELIVERABLE")
-    print("=" * 64)
-    print()
-    print(result.deliverable)
+    out.append("")
+    out.append("=" * 64)
+    out.append("DELIVERABLE")
+    out.append("=" * 64)
+    out.append("")
+    out.append(result.deliverable)
+    _write_lines(out)
 
 
 def _run_batch(api_key: str, task: str, budgets: list[float],
@@ -264,16 +327,32 @@ def _run_batch(api_key: str, task: str, budgets: list[float],
     print(f"Budgets:  {', '.join(f'${b:.4f}' for b in budgets)}")
     print(f"Workers:  {concurrency}")
     print()
+    t0 = time.perf_counter()
+
+    # The plan does not depend on the budget, so make it once for the sweep.
+    print("=" * 80)
+    print("PLAN (shared)")
+    print("=" * 80)
+
+    threading.Thread(target=warm_up, args=(api_key,), daemon=True).start()
+    planner_result = PlannerAgent(api_key=api_key).plan(task)
+    planner_cost = _planner_cost_dollars(
+        planner_result.usage.prompt_tokens,
+        planner_result.usage.completion_tokens,
+    )
+    _write_lines(_subtask_lines(planner_result.graph))
+    print(f"\n  Planner cost: ${planner_cost:.6f}  "
+          f"({planner_result.usage.total_tokens} total tokens)")
 
-    t0 = time.time()
     traces = run_batch(
         api_key=api_key,
         task=task,
         budgets=budgets,
         max_concurrency=concurrency,
         evaluate=evaluate,
+        planner_result=planner_result,
     )
-    elapsed = time.time() - t0
+    elapsed = time.perf_counter() - t0
 
     # ── Comparison table ─────────────────────────────────────────────────
     print()
@@ -288,10 +367,11 @@ def _run_batch(api_key: str, task: str, budgets: list[float],
     print(header)
     print(f"  {'─'*8}  {'─'*10}  {'─'*7}  {'─'*5}  {'─'*8}  {'─'*6}  {'─'*7}  {'─'*6}")
 
+    lines = []
     for tr in traces:
         qual = tr.deliverable_quality.overall if tr.deliverable_quality else -1.0
         dm = compute_text_metrics(tr.deliverable) if tr.deliverable else None
-        print(
+        lines.append(
             f"  ${tr.budget_dollars:>7.4f}"
             f"  ${tr.total_cost_dollars:>9.6f}"
             f"  {qual:>6.1f}"
@@ -301,6 +381,7 @@ def _run_batch(api_key: str, task: str, budgets: list[float],
             f"  {dm.filler_phrase_count if dm else 0:>7}"
             f"  {dm.word_count if dm else 0:>6}"
         )
+    _write_lines(lines)
 
     print(f"\n  Wall time: {elapsed:.1f}s")
     print(f"  Traces saved: {len(traces)}")
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Complexity(str, Enum):
@@ -13,12 +16,18 @@ class Complexity(str, Enum):
     MEDIUM = "medium"
     HIGH = "high"
 
+    # Enum.__hash__ is a Python-level call; members are used as dict keys in
+    # every per-subtask pricing/model lookup, so hash as the plain string.
+    __hash__ = str.__hash__
+
 
 class Tier(str, Enum):
     FAST = "fast"
     DEEP = "deep"
     VERIFY = "verify"
 
+    __hash__ = str.__hash__
+
 
 TIER_MODELS = {
     Tier.FAST: "gemini-2.5-flash-lite",
@@ -57,6 +66,8 @@ TIER_PRICING_PER_1M_OUTPUT = {
 
 
 class SubTask(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     id: int
     description: str
     complexity: Complexity
@@ -66,8 +77,49 @@ class SubTask(BaseModel):
 class TaskGraph(BaseModel):
     subtasks: list[SubTask]
 
+    @cached_property
+    def layers(self) -> list[list[int]]:
+        """Subtask IDs grouped into dependency levels (Kahn's algorithm).
+
+        Every subtask in a level depends only on earlier levels. Computed on
+        first access; the graph is not mutated after planning.
+        """
+        in_degree = {s.id: len(s.dependencies) for s in self.subtasks}
+        dependents: dict[int, list[int]] = defaultdict(list)
+        for s in self.subtasks:
+            for dep in s.dependencies:
+                dependents[dep].append(s.id)
+
+        level = {sid: 0 for sid, deg in in_degree.items() if deg == 0}
+        queue = deque(level)
+        while queue:
+            sid = queue.popleft()
+            for child in dependents[sid]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    level[child] = level[sid] + 1
+                    queue.append(child)
+
+        depth = max(level.values(), default=-1) + 1
+        layers: list[list[int]] = [[] for _ in range(depth)]
+        for sid in sorted(level):
+            layers[level[sid]].append(sid)
+        return layers
+
+    @property
+    def max_depth(self) -> int:
+        """Longest path through the DAG (number of edges)."""
+        return max(len(self.layers) - 1, 0)
+
+    @property
+    def parallelizable_subtasks(self) -> int:
+        """Count subtasks with no dependencies (could run concurrently)."""
+        return len(self.layers[0]) if self.layers else 0
+
 
 class TokenUsage(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     prompt_tokens: int
     completion_tokens: int
     total_tokens: int
@@ -84,8 +136,13 @@ class PlannerResult(BaseModel):
 # Allocator models
 # ---------------------------------------------------------------------------
 
+# Allocation, execution and metrics models are built per subtask and never
+# parsed from model output, so they are plain slotted dataclasses rather than
+# validated Pydantic models.
 
-class SubTaskAllocation(BaseModel):
+
+@dataclass(slots=True)
+class SubTaskAllocation:
     subtask_id: int
     tier: Tier
     model: str
@@ -94,13 +151,14 @@ class SubTaskAllocation(BaseModel):
     skipped: bool = False
 
 
-class ExecutionPlan(BaseModel):
+@dataclass(slots=True)
+class ExecutionPlan:
     allocations: list[SubTaskAllocation]
     total_estimated_tokens: int
     total_estimated_cost_dollars: float
     budget_tokens: int
     budget_dollars: float
-    downgrades_applied: list[str] = []
+    downgrades_applied: list[str] = field(default_factory=list)
 
 
 # ---------------------------------------------------------------------------
@@ -108,7 +166,8 @@ class ExecutionPlan(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-class SubTaskAttempt(BaseModel):
+@dataclass(slots=True)
+class SubTaskAttempt:
     tier: Tier
     model: str
     output: str
@@ -118,7 +177,8 @@ class SubTaskAttempt(BaseModel):
     completion_tokens: int
 
 
-class ROIDecision(BaseModel):
+@dataclass(slots=True)
+class ROIDecision:
     subtask_id: int
     current_tier: Tier
     current_quality: float
@@ -130,7 +190,8 @@ class ROIDecision(BaseModel):
     reason: str
 
 
-class SubTaskResult(BaseModel):
+@dataclass(slots=True)
+class SubTaskResult:
     subtask_id: int
     description: str
     tier: Tier
@@ -144,12 +205,34 @@ class SubTaskResult(BaseModel):
     output: str
     skipped: bool = False
     prompt: str = ""
-    attempts: list[SubTaskAttempt] = []
-    roi_decisions: list[ROIDecision] = []
+    attempts: list[SubTaskAttempt] = field(default_factory=list)
+    roi_decisions: list[ROIDecision] = field(default_factory=list)
     final_attempt_index: int = 0
 
 
-class CostReport(BaseModel):
+_COST_REPORT_TEMPLATE = """
+  Budget Summary
+    Budget:      ${r.budget_dollars:.4f}
+    Spent:       ${r.spent_dollars:.6f}
+    Remaining:   ${r.remaining_dollars:.6f}
+    Utilization: {r.utilization_pct:.1f}%
+
+  Tier Distribution
+{tiers}    Upgrades: {r.total_upgrades}  │  Eval cost: ${r.evaluation_cost_dollars:.6f}
+
+  Efficiency
+    Tokens budgeted:  {r.total_tokens_budgeted:,}
+    Tokens consumed:  {r.total_tokens_consumed:,}
+    Total surplus:    {r.total_surplus:,}
+    Token efficiency: {r.token_efficiency_pct:.1f}%
+
+  Task Graph
+    Subtasks: {r.total_subtasks}  │  Max depth: {r.max_depth}  │  Parallelizable: {r.parallelizable_subtasks}
+    Complexity: {r.complexity_distribution}"""
+
+
+@dataclass(slots=True)
+class CostReport:
     budget_dollars: float
     spent_dollars: float
     remaining_dollars: float
@@ -174,11 +257,21 @@ class CostReport(BaseModel):
     complexity_distribution: dict[str, int]
 
     total_upgrades: int = 0
-    roi_decisions: list[ROIDecision] = []
+    roi_decisions: list[ROIDecision] = field(default_factory=list)
     evaluation_cost_dollars: float = 0.0
 
+    def to_text(self) -> str:
+        """Render the budget, tier, efficiency and task-graph report sections."""
+        tiers = "".join(
+            f"    {tier_name:<8} {count} subtask(s)\n"
+            for tier_name, count in self.tier_counts.items()
+            if count > 0
+        )
+        return _COST_REPORT_TEMPLATE.format(r=self, tiers=tiers)
 
-class ExecutorResult(BaseModel):
+
+@dataclass(slots=True)
+class ExecutorResult:
     deliverable: str
     report: CostReport
 
@@ -197,7 +290,8 @@ class QualityScore(BaseModel):
     rationale: str = ""
 
 
-class TextMetrics(BaseModel):
+@dataclass(slots=True)
+class TextMetrics:
     word_count: int = 0
     type_token_ratio: float = 0.0
     compression_ratio: float = 0.0
@@ -206,6 +300,10 @@ class TextMetrics(BaseModel):
     filler_phrase_count: int = 0
 
 
+# Planner and subtask trace timestamps are left unset at construction; the
+# RunTrace stamps them with its own time, taken once per run.
+
+
 class SubTaskTrace(BaseModel):
     subtask_id: int
     description: str
@@ -222,7 +320,7 @@ class SubTaskTrace(BaseModel):
     skipped: bool = False
     quality: Optional[QualityScore] = None
     text_metrics: Optional[TextMetrics] = None
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: Optional[str] = None
 
 
 class PlannerTrace(BaseModel):
@@ -233,7 +331,7 @@ class PlannerTrace(BaseModel):
     total_tokens: int = 0
     cost_dollars: float = 0.0
     graph_json: str = ""
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    timestamp: Optional[str] = None
 
 
 class RunTrace(BaseModel):
@@ -247,3 +345,8 @@ class RunTrace(BaseModel):
     total_cost_dollars: float = 0.0
     evaluation_cost_dollars: float = 0.0
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def model_post_init(self, __context) -> None:
+        for child in (self.planner_trace, *self.subtask_traces):
+            if child.timestamp is None:
+                child.timestamp = self.timestamp